@@ -1,6 +1,7 @@
 """GitHub-specific data extraction."""
 
 import re
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 from utils.text import extract_evidence_lines, truncate_text
 
@@ -101,7 +102,7 @@ class GitHubExtractor:
             "content": content,
             "evidence_snippets": evidence,
             "has_demo_link": len(demo_links) > 0,
-            "demo_links": list(set(demo_links))[:5],  # Limit to 5
+            "demo_links": list(dict.fromkeys(demo_links))[:5],  # Limit to 5
         }
 
     def extract_search_result(self, item: Dict, result_type: str) -> Dict:
@@ -145,7 +146,6 @@ class GitHubExtractor:
         max_score += 0.2
         pushed_at = repo.get("pushed_at", "")
         if pushed_at:
-            from datetime import datetime, timezone
             try:
                 pushed = datetime.fromisoformat(pushed_at.replace("Z", "+00:00"))
                 now = datetime.now(timezone.utc)
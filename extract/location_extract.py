@@ -1,6 +1,7 @@
 """Location extraction and classification."""
 
 import re
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 
@@ -122,14 +123,59 @@ NON_US_PATTERNS = [
 ]
 
 
+# Compiled once and shared by every extractor instance
+_SF_REGEXES = [re.compile(p, re.IGNORECASE) for p in SF_BAY_AREA_PATTERNS]
+_US_REGEXES = [re.compile(p, re.IGNORECASE) for p in OTHER_US_PATTERNS]
+_NON_US_REGEXES = [re.compile(p, re.IGNORECASE) for p in NON_US_PATTERNS]
+
+# Explicit location mentions in page text
+_LOCATION_INDICATOR_REGEXES = [
+    re.compile(r"(?:location|based|located|address|headquarters?)[\s:]+([^\n<]{5,50})", re.IGNORECASE),
+    re.compile(r"(?:based\s+in|located\s+in)\s+([^\n<]{5,50})", re.IGNORECASE),
+]
+
+
+# Longer inputs (bios, page bodies) rarely repeat, so they bypass the cache
+# instead of pinning whole pages in it
+_MAX_CACHED_TEXT = 200
+
+
+def _classify(text_lower: str) -> Tuple[str, float]:
+    """Classify lowercased text into (metro_bucket, confidence)."""
+    # Check SF Bay Area first (highest priority)
+    sf_matches = sum(1 for p in _SF_REGEXES if p.search(text_lower))
+    if sf_matches > 0:
+        confidence = min(0.6 + (sf_matches * 0.15), 1.0)
+        return ("SF_BAY_AREA", confidence)
+
+    # Check non-US (before general US to avoid false positives)
+    non_us_matches = sum(1 for p in _NON_US_REGEXES if p.search(text_lower))
+    if non_us_matches > 0:
+        confidence = min(0.5 + (non_us_matches * 0.15), 1.0)
+        return ("NON_US", confidence)
+
+    # Check other US locations
+    us_matches = sum(1 for p in _US_REGEXES if p.search(text_lower))
+    if us_matches > 0:
+        confidence = min(0.5 + (us_matches * 0.15), 1.0)
+        return ("OTHER_US", confidence)
+
+    return ("UNKNOWN", 0.0)
+
+
+@lru_cache(maxsize=8192)
+def _classify_cached(text_lower: str) -> Tuple[str, float]:
+    """Memoized _classify for short strings; location fields repeat heavily."""
+    return _classify(text_lower)
+
+
 class LocationExtractor:
     """Extracts and classifies location information."""
 
     def __init__(self):
-        # Compile patterns for efficiency
-        self._sf_patterns = [re.compile(p, re.IGNORECASE) for p in SF_BAY_AREA_PATTERNS]
-        self._us_patterns = [re.compile(p, re.IGNORECASE) for p in OTHER_US_PATTERNS]
-        self._non_us_patterns = [re.compile(p, re.IGNORECASE) for p in NON_US_PATTERNS]
+        self._sf_patterns = _SF_REGEXES
+        self._us_patterns = _US_REGEXES
+        self._non_us_patterns = _NON_US_REGEXES
 
     def extract(
         self,
@@ -190,26 +236,9 @@ class LocationExtractor:
             return ("UNKNOWN", 0.0)
 
         text_lower = text.lower()
-
-        # Check SF Bay Area first (highest priority)
-        sf_matches = sum(1 for p in self._sf_patterns if p.search(text_lower))
-        if sf_matches > 0:
-            confidence = min(0.6 + (sf_matches * 0.15), 1.0)
-            return ("SF_BAY_AREA", confidence)
-
-        # Check non-US (before general US to avoid false positives)
-        non_us_matches = sum(1 for p in self._non_us_patterns if p.search(text_lower))
-        if non_us_matches > 0:
-            confidence = min(0.5 + (non_us_matches * 0.15), 1.0)
-            return ("NON_US", confidence)
-
-        # Check other US locations
-        us_matches = sum(1 for p in self._us_patterns if p.search(text_lower))
-        if us_matches > 0:
-            confidence = min(0.5 + (us_matches * 0.15), 1.0)
-            return ("OTHER_US", confidence)
-
-        return ("UNKNOWN", 0.0)
+        if len(text_lower) > _MAX_CACHED_TEXT:
+            return _classify(text_lower)
+        return _classify_cached(text_lower)
 
     def _bucket_to_country(self, bucket: str) -> str:
         """Convert metro bucket to country classification."""
@@ -237,19 +266,42 @@ class LocationExtractor:
 
         return None
 
+    def _find_location_indicator(self, html_text: str) -> Optional[str]:
+        """Find an explicit location mention (about sections, footer, contact info)."""
+        for pattern in _LOCATION_INDICATOR_REGEXES:
+            match = pattern.search(html_text)
+            if match:
+                return match.group(1).strip()
+        return None
+
     def extract_from_html(self, html_text: str, url: Optional[str] = None) -> LocationResult:
         """Extract location from HTML page content."""
-        # Look for location in about sections, footer, contact info
-        location_indicators = [
-            r"(?:location|based|located|address|headquarters?)[\s:]+([^\n<]{5,50})",
-            r"(?:based\s+in|located\s+in)\s+([^\n<]{5,50})",
-        ]
-
-        for pattern in location_indicators:
-            match = re.search(pattern, html_text, re.IGNORECASE)
-            if match:
-                location_text = match.group(1).strip()
-                return self.extract(location_field=location_text, evidence_url=url)
+        location_text = self._find_location_indicator(html_text)
+        if location_text:
+            return self.extract(location_field=location_text, evidence_url=url)
 
         # Fall back to classifying the whole text
         return self.extract(about_text=html_text, evidence_url=url)
+
+    def extract_best(
+        self,
+        bio_text: Optional[str] = None,
+        page_text: Optional[str] = None,
+        evidence_url: Optional[str] = None,
+    ) -> LocationResult:
+        """
+        Combine extract() over bio/page text with extract_from_html() over the
+        page, returning the more confident result.
+
+        Without an explicit location indicator, extract_from_html() would only
+        reclassify the page text already covered here, so that pass is skipped.
+        """
+        result = self.extract(bio_text=bio_text, about_text=page_text)
+
+        location_text = self._find_location_indicator(page_text) if page_text else None
+        if location_text:
+            page_result = self.extract(location_field=location_text, evidence_url=evidence_url)
+            if page_result.confidence > result.confidence:
+                return page_result
+
+        return result
@@ -17,6 +17,7 @@ from typing import List
 
 from utils.logging import setup_logger, get_logger
 from utils.dedupe import Candidate, CandidateDeduper
+from utils.rate_limit import enable_response_cache
 from sources.github import GitHubSource
 from sources.hn import HackerNewsSource
 from sources.brave_search import BraveSearchSource
@@ -43,6 +44,10 @@ def run_search(args):
 
     logger.info(f"Starting search with limit={args.limit}")
 
+    if args.http_cache:
+        enable_response_cache(args.http_cache)
+        logger.info(f"Caching HTTP responses in {args.http_cache}")
+
     # Initialize components
     deduper = CandidateDeduper()
     results_dir = setup_results_dir()
@@ -255,7 +260,7 @@ def save_csv(candidates: List[Candidate], path: Path):
                 "location_confidence": f"{c.location_confidence:.2f}",
                 "github_url": c.github_url or "",
                 "website": c.website or "",
-                "demo_urls": "; ".join(c.demo_urls[:3]) if c.demo_urls else "",
+                "demo_urls": "; ".join(list(c.demo_urls)[:3]) if c.demo_urls else "",
                 "sources": ", ".join(c.sources) if c.sources else "",
                 "shipping_velocity": c.scores.get("shipping_velocity", 0),
                 "tooling_signals": c.scores.get("tooling_signals", 0),
@@ -349,6 +354,13 @@ Environment variables:
         action="store_true",
         help="Don't fetch linked pages (faster but less data)",
     )
+    search_parser.add_argument(
+        "--http-cache",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help="Cache HN/ProductHunt responses on disk in DIR for faster repeat runs",
+    )
     search_parser.add_argument(
         "--llm",
         action="store_true",
@@ -109,7 +109,7 @@ Output JSON format:
             metro_bucket=candidate.metro_bucket,
             bio=candidate.bio[:500] if candidate.bio else "N/A",
             website=candidate.website or "N/A",
-            demo_urls=", ".join(candidate.demo_urls[:3]) if candidate.demo_urls else "N/A",
+            demo_urls=", ".join(list(candidate.demo_urls)[:3]) if candidate.demo_urls else "N/A",
             sources=", ".join(candidate.sources) if candidate.sources else "N/A",
             evidence=evidence_text or "No evidence snippets",
             shipping_velocity=candidate.scores.get("shipping_velocity", 0),
@@ -1,6 +1,7 @@
 """Transparent scoring rubric for candidates."""
 
 import re
+import time
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
@@ -258,21 +259,15 @@ class CandidateScorer:
             explanations.append(f"+{bonus}: has {len(candidate.demo_urls)} demo URL(s)")
 
         # Bonus for recent activity
-        if candidate.last_activity:
-            from datetime import datetime, timezone
-            try:
-                last = datetime.fromisoformat(candidate.last_activity.replace("Z", "+00:00"))
-                now = datetime.now(timezone.utc)
-                days_ago = (now - last).days
-
-                if days_ago < 30:
-                    points += 4
-                    explanations.append("+4: active in last 30 days")
-                elif days_ago < 90:
-                    points += 2
-                    explanations.append("+2: active in last 90 days")
-            except:
-                pass
+        if candidate.last_activity_epoch is not None:
+            days_ago = (time.time() - candidate.last_activity_epoch) // 86400
+
+            if days_ago < 30:
+                points += 4
+                explanations.append("+4: active in last 30 days")
+            elif days_ago < 90:
+                points += 2
+                explanations.append("+2: active in last 90 days")
 
         # Bonus for GitHub stars
         if candidate.stars_total >= 100:
@@ -434,7 +434,7 @@ class BraveSearchSource:
                 candidate = self._build_candidate(result, page_data)
                 if candidate:
                     # Store builder confidence as evidence for transparency
-                    candidate.evidence_snippets.append({
+                    candidate.add_evidence({
                         "text": f"Builder confidence: {confidence:.2f}",
                         "url": url,
                         "source": "brave_builder_detection",
@@ -525,7 +525,7 @@ class BraveSearchSource:
             linkedin_url=linkedin_url,
             twitter_handle=twitter_handle,
             website=website,
-            demo_urls=list(set(demo_urls))[:5],
+            demo_urls=list(dict.fromkeys(demo_urls))[:5],
             source_urls=[url],
             bio=page_data.get("description") if page_data else desc,
             evidence_snippets=evidence,
@@ -12,6 +12,34 @@ from extract.location_extract import LocationExtractor
 
 logger = get_logger(source="devto")
 
+# (output key, API key, default) projections applied to Forem API payloads
+_ARTICLE_FIELDS = (
+    ("id", "id", None),
+    ("title", "title", ""),
+    ("description", "description", ""),
+    ("url", "url", None),
+    ("canonical_url", "canonical_url", None),
+    ("published_at", "published_at", None),
+    ("positive_reactions_count", "positive_reactions_count", 0),
+    ("comments_count", "comments_count", 0),
+    ("reading_time_minutes", "reading_time_minutes", 0),
+    ("tags", "tag_list", ()),
+    ("user", "user", None),
+)
+
+_USER_FIELDS = (
+    ("id", "id", None),
+    ("username", "username", None),
+    ("name", "name", None),
+    ("bio", "summary", None),
+    ("location", "location", None),
+    ("website_url", "website_url", None),
+    ("github_username", "github_username", None),
+    ("twitter_username", "twitter_username", None),
+    ("profile_image", "profile_image", None),
+    ("joined_at", "joined_at", None),
+)
+
 
 class DevToSource:
     """Crawls Dev.to for vibe coding candidates via Forem API."""
@@ -96,40 +124,16 @@ class DevToSource:
         if not articles:
             return []
 
-        results = []
-        for article in articles[:max_results]:
-            results.append({
-                "id": article.get("id"),
-                "title": article.get("title", ""),
-                "description": article.get("description", ""),
-                "url": article.get("url"),
-                "canonical_url": article.get("canonical_url"),
-                "published_at": article.get("published_at"),
-                "positive_reactions_count": article.get("positive_reactions_count", 0),
-                "comments_count": article.get("comments_count", 0),
-                "reading_time_minutes": article.get("reading_time_minutes", 0),
-                "tags": article.get("tag_list", []),
-                "user": article.get("user", {}),
-            })
-
-        return results
+        return [
+            {key: article.get(api_key, default) for key, api_key, default in _ARTICLE_FIELDS}
+            for article in articles[:max_results]
+        ]
 
     def get_user(self, username: str) -> Optional[Dict]:
         """Get user profile by username."""
         data = self._api_request(f"/users/by_username", {"url": username})
         if data:
-            return {
-                "id": data.get("id"),
-                "username": data.get("username"),
-                "name": data.get("name"),
-                "bio": data.get("summary"),
-                "location": data.get("location"),
-                "website_url": data.get("website_url"),
-                "github_username": data.get("github_username"),
-                "twitter_username": data.get("twitter_username"),
-                "profile_image": data.get("profile_image"),
-                "joined_at": data.get("joined_at"),
-            }
+            return {key: data.get(api_key, default) for key, api_key, default in _USER_FIELDS}
         return None
 
     def get_user_articles(self, username: str, max_articles: int = 5) -> List[Dict]:
@@ -146,7 +150,7 @@ class DevToSource:
     def _extract_github_from_article(self, article: Dict) -> Optional[str]:
         """Extract GitHub username from article content or links."""
         # Check user's github_username first
-        user = article.get("user", {})
+        user = article.get("user") or {}
         if user.get("github_username"):
             return user["github_username"]
 
@@ -157,7 +161,8 @@ class DevToSource:
         """Score how relevant an article is for vibe coding signals."""
         score = 0.0
         text = f"{article.get('title', '')} {article.get('description', '')}".lower()
-        tags = [t.lower() for t in article.get("tags", [])]
+        # Tags appended once, tab-separated so no keyword spans a boundary
+        text_with_tags = text + "\t" + "\t".join(article.get("tags", [])).lower()
 
         # High-signal keywords
         high_signal = ["shipped", "launched", "built", "prototype", "mvp", "demo", "weekend project"]
@@ -168,13 +173,13 @@ class DevToSource:
         # Tool signals
         tool_signals = ["cursor", "v0", "replit", "copilot", "langchain", "openai", "anthropic", "claude", "gpt"]
         for tool in tool_signals:
-            if tool in text or tool in tags:
+            if tool in text_with_tags:
                 score += 0.1
 
         # Founder signals
         founder_signals = ["founder", "startup", "yc", "bootstrapped", "indie"]
         for signal in founder_signals:
-            if signal in text or signal in tags:
+            if signal in text_with_tags:
                 score += 0.1
 
         # Engagement bonus
@@ -216,7 +221,7 @@ class DevToSource:
                 if candidates_found >= limit:
                     break
 
-                user = article.get("user", {})
+                user = article.get("user") or {}
                 username = user.get("username")
 
                 if not username or username in self._seen_authors:
@@ -247,7 +252,7 @@ class DevToSource:
         user_profile: Optional[Dict],
     ) -> Optional[Candidate]:
         """Build a Candidate from Dev.to data."""
-        user = article.get("user", {})
+        user = article.get("user") or {}
         username = user.get("username")
         if not username:
             return None
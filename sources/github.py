@@ -2,10 +2,14 @@
 
 import os
 import re
-import base64
 from typing import Dict, Generator, List, Optional, Set
 from datetime import datetime, timedelta
 
+try:
+    import pybase64 as base64  # SIMD-accelerated, drop-in compatible
+except ImportError:
+    import base64
+
 from utils.rate_limit import rate_limited_request
 from utils.logging import get_logger, log_progress
 from utils.dedupe import Candidate
@@ -174,6 +178,10 @@ class GitHubSource:
                 if len(results) >= max_results:
                     break
 
+            # A short page means there is nothing left to fetch
+            if len(items) < per_page:
+                break
+
             page += 1
 
             # Respect search result limits
@@ -477,7 +485,7 @@ class GitHubSource:
             linkedin_url=linkedin_url,
             github_url=user.get("html_url"),
             website=user.get("blog") or None,
-            demo_urls=list(set(demo_urls))[:5],
+            demo_urls=list(dict.fromkeys(demo_urls))[:5],
             source_urls=[repo.get("html_url")],
             bio=user.get("bio"),
             evidence_snippets=evidence,
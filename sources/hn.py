@@ -1,8 +1,12 @@
 """Hacker News source crawler using Algolia HN Search API."""
 
 import re
-from typing import Dict, Generator, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Generator, Iterator, Optional, Set
 from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+import orjson
 
 from utils.rate_limit import rate_limited_request
 from utils.logging import get_logger, log_progress
@@ -13,6 +17,39 @@ from extract.html_extract import HTMLExtractor
 
 logger = get_logger(source="hn")
 
+# (output key, Algolia key, default) projection applied to each search hit
+_HIT_FIELDS = (
+    ("id", "objectID", None),
+    ("title", "title", ""),
+    ("url", "url", None),
+    ("author", "author", None),
+    ("points", "points", 0),
+    ("num_comments", "num_comments", 0),
+    ("created_at", "created_at", None),
+    ("story_text", "story_text", None),  # For text posts
+)
+
+# Hosts that are never someone's personal site; skipped before the
+# personal-site heuristic and page fetch
+_NON_PERSONAL_HOSTS = frozenset({
+    "github.com", "www.github.com",
+    "twitter.com", "www.twitter.com", "x.com",
+    "youtube.com", "www.youtube.com", "youtu.be",
+    "dev.to",
+    "news.ycombinator.com",
+})
+
+
+def _is_personal_site_url(url: str) -> bool:
+    """Personal-site check with a cheap hostname denylist in front."""
+    try:
+        hostname = urlsplit(url).hostname
+    except ValueError:  # Malformed URL (bad IPv6 brackets, port, ...)
+        return False
+    if hostname in _NON_PERSONAL_HOSTS:
+        return False
+    return is_likely_personal_site(url)
+
 
 class HackerNewsSource:
     """Crawls Hacker News for Show HN posts with vibe coding signals."""
@@ -49,31 +86,51 @@ class HackerNewsSource:
         "Show HN startup",
     ]
 
-    def __init__(self, fetch_personal_sites: bool = True, max_results_per_query: int = 20):
+    # Largest page we request from Algolia in a single call; only a ceiling for
+    # max_results_per_query above it (the default of 20 fits in one page)
+    MAX_HITS_PER_PAGE = 100
+
+    def __init__(
+        self,
+        fetch_personal_sites: bool = True,
+        max_results_per_query: int = 20,
+        max_workers: int = 8,
+    ):
         self.base_url = "https://hn.algolia.com/api/v1"
         self.fetch_personal_sites = fetch_personal_sites
         self.max_results_per_query = max_results_per_query
+        self.max_workers = max_workers
         self.location_extractor = LocationExtractor()
         self.html_extractor = HTMLExtractor()
         self._seen_authors: Set[str] = set()
+        self._user_cache: Dict[str, Optional[Dict]] = {}
 
-    def search(self, query: str, tags: str = "show_hn", max_results: int = 20) -> List[Dict]:
+    def reset(self) -> None:
+        """Forget seen authors and cached profiles (for long-running processes)."""
+        self._seen_authors.clear()
+        self._user_cache.clear()
+
+    def search(self, query: str, tags: str = "show_hn", max_results: int = 20) -> Iterator[Dict]:
         """
         Search HN using Algolia API.
 
+        Pages are fetched lazily, so a caller that stops iterating early
+        never requests the remaining pages.
+
         Args:
             query: Search query
             tags: HN tags to filter (show_hn, ask_hn, story, etc.)
             max_results: Maximum results to return
 
-        Returns:
-            List of story objects
+        Yields:
+            Story objects
         """
-        results = []
+        returned = 0
         page = 0
-        hits_per_page = min(20, max_results)
+        # Ask for everything in as few round-trips as Algolia allows
+        hits_per_page = min(self.MAX_HITS_PER_PAGE, max_results)
 
-        while len(results) < max_results:
+        while returned < max_results:
             params = {
                 "query": query,
                 "tags": tags,
@@ -91,46 +148,37 @@ class HackerNewsSource:
 
                 if response.status_code != 200:
                     logger.warning(f"HN API error: {response.status_code}")
-                    break
+                    return
 
-                data = response.json()
-                hits = data.get("hits", [])
-
-                if not hits:
-                    break
-
-                for hit in hits:
-                    results.append(self._extract_story(hit))
-                    if len(results) >= max_results:
-                        break
+                data = orjson.loads(response.content)
+            except Exception as e:
+                logger.error(f"HN search failed: {e}")
+                return
 
-                page += 1
+            hits = data.get("hits", [])
+            if not hits:
+                return
 
-                # Algolia limits
-                if page >= data.get("nbPages", 1):
-                    break
+            for hit in hits[:max_results - returned]:
+                returned += 1
+                yield self._extract_story(hit)
 
-            except Exception as e:
-                logger.error(f"HN search failed: {e}")
-                break
+            page += 1
 
-        return results
+            # Algolia limits
+            if page >= data.get("nbPages", 1):
+                return
 
     def _extract_story(self, hit: Dict) -> Dict:
         """Extract relevant fields from an Algolia hit."""
-        return {
-            "id": hit.get("objectID"),
-            "title": hit.get("title", ""),
-            "url": hit.get("url"),
-            "author": hit.get("author"),
-            "points": hit.get("points", 0),
-            "num_comments": hit.get("num_comments", 0),
-            "created_at": hit.get("created_at"),
-            "story_text": hit.get("story_text"),  # For text posts
-        }
+        return {key: hit.get(api_key, default) for key, api_key, default in _HIT_FIELDS}
 
     def get_user(self, username: str) -> Optional[Dict]:
-        """Get HN user profile."""
+        """Get HN user profile (memoized per source instance)."""
+        if username in self._user_cache:
+            return self._user_cache[username]
+
+        user = None
         try:
             response = rate_limited_request(
                 source="hn",
@@ -139,17 +187,19 @@ class HackerNewsSource:
             )
 
             if response.status_code == 200:
-                data = response.json()
-                return {
+                data = orjson.loads(response.content)
+                user = {
                     "username": data.get("username"),
                     "about": data.get("about"),
                     "karma": data.get("karma", 0),
                     "created_at": data.get("created_at"),
                 }
+            # Only definitive answers are cached; transient failures can retry
+            self._user_cache[username] = user
         except Exception as e:
             logger.debug(f"Failed to get HN user {username}: {e}")
 
-        return None
+        return user
 
     def _fetch_page(self, url: str) -> Optional[Dict]:
         """Fetch and extract data from a page URL."""
@@ -189,46 +239,62 @@ class HackerNewsSource:
 
         logger.info(f"Starting HN crawl with {total_queries} queries, limit={limit}")
 
-        for query_idx, query in enumerate(self.SEARCH_QUERIES):
-            if candidates_found >= limit:
-                break
+        # Per-story profile and page fetches overlap on the pool; searches run
+        # lazily so a reached limit stops further Algolia requests
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for query_idx, query in enumerate(self.SEARCH_QUERIES):
+                if candidates_found >= limit:
+                    break
 
-            log_progress(logger, query_idx + 1, total_queries, f"Query: {query}")
+                log_progress(logger, query_idx + 1, total_queries, f"Query: {query}")
 
-            stories = self.search(query, max_results=self.max_results_per_query)
-            logger.info(f"Found {len(stories)} stories")
+                num_stories = 0
+                eligible = []
+                for story in self.search(query, max_results=self.max_results_per_query):
+                    num_stories += 1
+                    author = story.get("author")
+                    if not author or author in self._seen_authors:
+                        continue
 
-            for story in stories:
-                if candidates_found >= limit:
-                    break
+                    self._seen_authors.add(author)
 
-                author = story.get("author")
-                if not author or author in self._seen_authors:
-                    continue
+                    # Skip low engagement stories
+                    points = story.get("points", 0)
+                    if points < 5:
+                        continue
 
-                self._seen_authors.add(author)
+                    eligible.append(story)
+                    if len(eligible) >= limit - candidates_found:
+                        break
+
+                logger.info(f"Found {num_stories} stories")
 
-                # Skip low engagement stories
-                points = story.get("points", 0)
-                if points < 5:
-                    continue
+                # Profile and linked-page fetches are independent, so overlap them
+                fetches = []
+                for story in eligible:
+                    user_future = pool.submit(self.get_user, story["author"])
 
-                # Get user profile
-                user = self.get_user(author)
+                    # Optionally fetch linked page
+                    page_future = None
+                    url = story.get("url")
+                    if self.fetch_personal_sites and url and _is_personal_site_url(url):
+                        page_future = pool.submit(self._fetch_page, url)
 
-                # Optionally fetch linked page
-                page_data = None
-                if self.fetch_personal_sites and story.get("url"):
-                    url = story["url"]
-                    if is_likely_personal_site(url):
-                        page_data = self._fetch_page(url)
+                    fetches.append((story, user_future, page_future))
 
-                # Build candidate
-                candidate = self._build_candidate(story, user, page_data)
-                if candidate:
-                    candidates_found += 1
-                    log_progress(logger, candidates_found, limit, f"Found: {author}")
-                    yield candidate
+                for story, user_future, page_future in fetches:
+                    user = user_future.result()
+                    page_data = page_future.result() if page_future else None
+
+                    # Build candidate
+                    candidate = self._build_candidate(story, user, page_data)
+                    if candidate:
+                        candidates_found += 1
+                        log_progress(logger, candidates_found, limit, f"Found: {story['author']}")
+                        yield candidate
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
         logger.info(f"HN crawl complete. Found {candidates_found} candidates")
 
@@ -243,6 +309,8 @@ class HackerNewsSource:
         if not author:
             return None
 
+        item_url = f"https://news.ycombinator.com/item?id={story.get('id')}"
+
         # Build evidence
         evidence = []
 
@@ -251,7 +319,7 @@ class HackerNewsSource:
         if title:
             evidence.append({
                 "text": title,
-                "url": f"https://news.ycombinator.com/item?id={story.get('id')}",
+                "url": item_url,
                 "source": "hn_title",
             })
 
@@ -260,7 +328,7 @@ class HackerNewsSource:
             for line in extract_evidence_lines(story["story_text"])[:2]:
                 evidence.append({
                     "text": line,
-                    "url": f"https://news.ycombinator.com/item?id={story.get('id')}",
+                    "url": item_url,
                     "source": "hn_text",
                 })
 
@@ -273,24 +341,16 @@ class HackerNewsSource:
                     "source": "hn_linked_page",
                 })
 
-        # Extract location from various sources
-        location_result = self.location_extractor.extract(
+        # Extract location from profile and page, keeping the best signal
+        location_result = self.location_extractor.extract_best(
             bio_text=user.get("about") if user else None,
-            about_text=page_data.get("main_content") if page_data else None,
+            page_text=page_data.get("main_content") if page_data else None,
+            evidence_url=page_data.get("url") if page_data else None,
         )
 
-        # If page has better location, use it
-        if page_data:
-            page_location = self.location_extractor.extract_from_html(
-                page_data.get("main_content", ""),
-                page_data.get("url"),
-            )
-            if page_location.confidence > location_result.confidence:
-                location_result = page_location
-
         # Collect links
         demo_urls = []
-        source_urls = [f"https://news.ycombinator.com/item?id={story.get('id')}"]
+        source_urls = [item_url]
 
         if story.get("url"):
             demo_urls.append(story["url"])
@@ -320,7 +380,7 @@ class HackerNewsSource:
             linkedin_url=linkedin_url,
             twitter_handle=twitter_handle,
             website=website,
-            demo_urls=list(set(demo_urls))[:5],
+            demo_urls=list(dict.fromkeys(demo_urls))[:5],
             source_urls=source_urls,
             bio=user.get("about") if user else None,
             evidence_snippets=evidence,
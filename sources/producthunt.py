@@ -1,8 +1,14 @@
 """ProductHunt source crawler."""
 
+import multiprocessing
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from typing import Dict, Generator, List, Optional, Set
 
+import lxml.html
+
+from utils.concurrency import windowed_map
 from utils.rate_limit import rate_limited_request
 from utils.logging import get_logger, log_progress
 from utils.dedupe import Candidate
@@ -11,6 +17,92 @@ from extract.html_extract import HTMLExtractor
 
 logger = get_logger(source="producthunt")
 
+# Product permalinks on topic pages
+_POSTS_HREF_RE = re.compile(r"^/posts/[\w-]+$")
+
+# Maker info in one pass: "Made by @username" / "Built by username" (group "by")
+# or "@username maker" (group "handle")
+_MAKER_RE = re.compile(
+    r"(?:made|built|created)\s+by\s+@?(?P<by>\w+)"
+    r"|@(?P<handle>\w{3,20})\s+(?:maker|founder|creator)",
+    re.IGNORECASE,
+)
+
+# Words the "made by X" pattern picks up that are never usernames
+_STOPWORDS = frozenset({"the", "a", "an", "this", "that"})
+
+# Shared extractor for product pages (one per process when parsing in workers)
+_PAGE_EXTRACTOR = HTMLExtractor()
+
+
+def _element_text(element) -> str:
+    """Concatenate an element's stripped text nodes (like BeautifulSoup get_text(strip=True))."""
+    return "".join(t.strip() for t in element.itertext())
+
+
+def _parse_topic_html(html: str, topic: str, base_url: str, max_products: int) -> List[Dict]:
+    """Parse products from topic page HTML (module-level so it can run in a worker process)."""
+    try:
+        tree = lxml.html.fromstring(html)
+    except (lxml.etree.ParserError, ValueError) as e:
+        logger.debug(f"Failed to parse topic page {topic}: {e}")
+        return []
+
+    products = []
+
+    # Look for product cards/links
+    # ProductHunt structure changes, so we use multiple selectors
+    product_links = [
+        a for a in tree.xpath('//a[starts-with(@href, "/posts/")]')
+        if _POSTS_HREF_RE.match(a.get("href", ""))
+    ]
+
+    seen_urls = set()
+    for link in product_links:
+        href = link.get("href", "")
+        if href in seen_urls:
+            continue
+        seen_urls.add(href)
+
+        product_url = f"{base_url}{href}"
+        parent = link.getparent()
+
+        # Try to get product name from link text or nearby elements
+        name = _element_text(link)
+        if not name or len(name) > 100:
+            # Try parent or sibling elements
+            if parent is not None:
+                h_tags = parent.xpath(".//*[self::h1 or self::h2 or self::h3]")
+                if h_tags:
+                    name = _element_text(h_tags[0])
+
+        if not name:
+            name = href.replace("/posts/", "").replace("-", " ").title()
+
+        # Try to get tagline/description
+        tagline = ""
+        if parent is not None:
+            p_tag = parent.find(".//p")
+            if p_tag is not None:
+                tagline = _element_text(p_tag)
+
+        products.append({
+            "name": name,
+            "url": product_url,
+            "tagline": tagline,
+            "topic": topic,
+        })
+
+        if len(products) >= max_products:
+            break
+
+    return products
+
+
+def _extract_product_html(html: str, url: str) -> Dict:
+    """Extract structured data from product page HTML (module-level for worker processes)."""
+    return _PAGE_EXTRACTOR.extract(html, url)
+
 
 class ProductHuntSource:
     """Crawls ProductHunt for makers of AI/vibe coding products."""
@@ -48,12 +140,27 @@ class ProductHuntSource:
         "launched",
     ]
 
-    def __init__(self, fetch_maker_pages: bool = True, max_products_per_topic: int = 20):
+    def __init__(
+        self,
+        fetch_maker_pages: bool = True,
+        max_products_per_topic: int = 20,
+        max_workers: int = 8,
+        parse_workers: Optional[int] = 0,
+    ):
+        """
+        Args:
+            fetch_maker_pages: Whether to fetch and parse each product page
+            max_products_per_topic: Maximum products to parse per topic page
+            max_workers: Threads for concurrent page fetches
+            parse_workers: Processes for HTML parsing (0 = parse in-thread, None = CPU count)
+        """
         self.base_url = "https://www.producthunt.com"
         self.fetch_maker_pages = fetch_maker_pages
         self.max_products_per_topic = max_products_per_topic
+        self.max_workers = max_workers
         self.location_extractor = LocationExtractor()
-        self.html_extractor = HTMLExtractor()
+        self.parse_workers = parse_workers
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
         self._seen_makers: Set[str] = set()
 
     def _fetch_topic_page(self, topic: str) -> Optional[str]:
@@ -87,63 +194,29 @@ class ProductHuntSource:
             if response.status_code != 200:
                 return None
 
-            return self.html_extractor.extract(response.text, product_url)
+            return self._run_parser(_extract_product_html, response.text, product_url)
         except Exception as e:
             logger.debug(f"Failed to fetch product page {product_url}: {e}")
             return None
 
+    def _fetch_topic_products(self, topic: str) -> Optional[List[Dict]]:
+        """Fetch a topic page and parse its products (None if the fetch failed)."""
+        html = self._fetch_topic_page(topic)
+        if not html:
+            return None
+        return self._parse_topic_page(html, topic)
+
     def _parse_topic_page(self, html: str, topic: str) -> List[Dict]:
         """Parse products from a topic page."""
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(html, "lxml")
-        products = []
-
-        # Look for product cards/links
-        # ProductHunt structure changes, so we use multiple selectors
-        product_links = soup.find_all("a", href=re.compile(r"^/posts/[\w-]+$"))
-
-        seen_urls = set()
-        for link in product_links:
-            href = link.get("href", "")
-            if href in seen_urls:
-                continue
-            seen_urls.add(href)
-
-            product_url = f"{self.base_url}{href}"
-
-            # Try to get product name from link text or nearby elements
-            name = link.get_text(strip=True)
-            if not name or len(name) > 100:
-                # Try parent or sibling elements
-                parent = link.find_parent()
-                if parent:
-                    h_tag = parent.find(["h1", "h2", "h3"])
-                    if h_tag:
-                        name = h_tag.get_text(strip=True)
-
-            if not name:
-                name = href.replace("/posts/", "").replace("-", " ").title()
-
-            # Try to get tagline/description
-            tagline = ""
-            parent = link.find_parent()
-            if parent:
-                p_tag = parent.find("p")
-                if p_tag:
-                    tagline = p_tag.get_text(strip=True)
-
-            products.append({
-                "name": name,
-                "url": product_url,
-                "tagline": tagline,
-                "topic": topic,
-            })
-
-            if len(products) >= self.max_products_per_topic:
-                break
+        return self._run_parser(
+            _parse_topic_html, html, topic, self.base_url, self.max_products_per_topic
+        )
 
-        return products
+    def _run_parser(self, parser, *args):
+        """Run a module-level parser in the process pool when one is active."""
+        if self._parse_pool is None:
+            return parser(*args)
+        return self._parse_pool.submit(parser, *args).result()
 
     def _extract_makers_from_page(self, page_data: Dict, product: Dict) -> List[Dict]:
         """Extract maker information from a product page."""
@@ -152,21 +225,13 @@ class ProductHuntSource:
         # Look for maker usernames in the page content
         content = page_data.get("main_content", "")
 
-        # Common patterns for maker info
-        # "Made by @username" or "Built by username"
-        maker_patterns = [
-            r"(?:made|built|created)\s+by\s+@?(\w+)",
-            r"@(\w{3,20})\s+(?:maker|founder|creator)",
-        ]
-
-        for pattern in maker_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                if match.lower() not in ["the", "a", "an", "this", "that"]:
-                    makers.append({
-                        "username": match,
-                        "source": "producthunt",
-                    })
+        for match in _MAKER_RE.finditer(content):
+            username = match.group("by") or match.group("handle")
+            if username.lower() not in _STOPWORDS:
+                makers.append({
+                    "username": username,
+                    "source": "producthunt",
+                })
 
         # Also check for social links
         github = page_data.get("github_username")
@@ -192,14 +257,14 @@ class ProductHuntSource:
         """Score how relevant a product is for vibe coding signals."""
         score = 0.0
 
-        text = f"{product.get('name', '')} {product.get('tagline', '')}".lower()
+        # Join once and lowercase once (only the first 1000 chars of page content)
+        parts = [product.get("name", ""), product.get("tagline", "")]
         if page_data:
-            text += f" {page_data.get('main_content', '')[:1000]}".lower()
+            parts.append(page_data.get("main_content", "")[:1000])
+        text = " ".join(parts).lower()
 
         # Check for vibe coding keywords
-        for keyword in self.VIBE_KEYWORDS:
-            if keyword in text:
-                score += 0.12
+        score += 0.12 * sum(keyword in text for keyword in self.VIBE_KEYWORDS)
 
         # Topic bonuses
         topic = product.get("topic", "")
@@ -223,54 +288,78 @@ class ProductHuntSource:
         total_topics = len(self.TOPICS)
 
         logger.info(f"Starting ProductHunt crawl with {total_topics} topics, limit={limit}")
+        if limit <= 0:
+            return
+
+        # Topic and product pages are independent fetches, so overlap them, but only
+        # a window sized by the remaining limit ahead of what is consumed (1 req/s)
+        # Opt-in: fetch threads can hand HTML parsing to worker processes. Spawned,
+        # not forked, since the logging listener and fetch threads are already running
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        if self.parse_workers != 0:
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        try:
+            topic_window = min(self.max_workers, -(-limit // self.max_products_per_topic))
+            topic_results = windowed_map(pool, self._fetch_topic_products, self.TOPICS, topic_window)
 
-        for topic_idx, topic in enumerate(self.TOPICS):
-            if candidates_found >= limit:
-                break
-
-            log_progress(logger, topic_idx + 1, total_topics, f"Topic: {topic}")
-
-            # Fetch topic page
-            html = self._fetch_topic_page(topic)
-            if not html:
-                continue
+            # Limit checks sit after each yield, so no extra result is pulled
+            # (and no extra fetch submitted) once the limit is reached
+            for topic_idx, (topic, products) in enumerate(zip(self.TOPICS, topic_results)):
+                log_progress(logger, topic_idx + 1, total_topics, f"Topic: {topic}")
 
-            # Parse products
-            products = self._parse_topic_page(html, topic)
-            logger.info(f"Found {len(products)} products for topic '{topic}'")
+                if products is None:
+                    continue
 
-            for product in products:
-                if candidates_found >= limit:
-                    break
+                logger.info(f"Found {len(products)} products for topic '{topic}'")
 
-                # Fetch product page if enabled
-                page_data = None
+                # Fetch product pages if enabled
                 if self.fetch_maker_pages:
-                    page_data = self._fetch_product_page(product["url"])
-
-                # Score relevance
-                relevance = self._score_product_relevance(product, page_data)
-                if relevance < 0.2:
-                    continue
-
-                # Extract makers
-                makers = []
-                if page_data:
-                    makers = self._extract_makers_from_page(page_data, product)
-
-                # Build candidate from product/maker info
-                candidate = self._build_candidate(product, page_data, makers)
-                if candidate:
-                    # Check if we've seen this maker
-                    maker_id = candidate.github_username or candidate.twitter_handle or candidate.website
-                    if maker_id and maker_id in self._seen_makers:
+                    product_pages = windowed_map(
+                        pool,
+                        self._fetch_product_page,
+                        [p["url"] for p in products],
+                        min(self.max_workers, limit - candidates_found),
+                    )
+                else:
+                    product_pages = repeat(None)
+
+                for product, page_data in zip(products, product_pages):
+                    # Score relevance
+                    relevance = self._score_product_relevance(product, page_data)
+                    if relevance < 0.2:
                         continue
-                    if maker_id:
-                        self._seen_makers.add(maker_id)
 
-                    candidates_found += 1
-                    log_progress(logger, candidates_found, limit, f"Found: {product.get('name', 'Unknown')}")
-                    yield candidate
+                    # Extract makers
+                    makers = []
+                    if page_data:
+                        makers = self._extract_makers_from_page(page_data, product)
+
+                    # Build candidate from product/maker info
+                    candidate = self._build_candidate(product, page_data, makers)
+                    if candidate:
+                        # Check if we've seen this maker
+                        maker_id = candidate.github_username or candidate.twitter_handle or candidate.website
+                        if maker_id and maker_id in self._seen_makers:
+                            continue
+                        if maker_id:
+                            self._seen_makers.add(maker_id)
+
+                        candidates_found += 1
+                        log_progress(logger, candidates_found, limit, f"Found: {product.get('name', 'Unknown')}")
+                        yield candidate
+                        if candidates_found >= limit:
+                            break
+
+                if candidates_found >= limit:
+                    break
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(wait=False, cancel_futures=True)
+                self._parse_pool = None
 
         logger.info(f"ProductHunt crawl complete. Found {candidates_found} candidates")
 
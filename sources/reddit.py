@@ -1,9 +1,14 @@
 """Reddit source crawler using the public JSON API."""
 
 import re
+import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Generator, List, Optional, Set
-from datetime import datetime
 
+import orjson
+
+from utils.concurrency import windowed_map
 from utils.rate_limit import rate_limited_request
 from utils.logging import get_logger, log_progress
 from utils.dedupe import Candidate
@@ -11,6 +16,44 @@ from extract.location_extract import LocationExtractor
 
 logger = get_logger(source="reddit")
 
+# Profile and demo links in post text, matched in one pass and dispatched on
+# the named group: GitHub user, Twitter/X handle, LinkedIn slug, or a demo URL
+# on a common hosting platform
+_LINK_RE = re.compile(
+    r'github\.com/(?P<github>[a-zA-Z0-9_-]+)'
+    r'|(?:twitter|x)\.com/(?P<twitter>[a-zA-Z0-9_]+)'
+    r'|linkedin\.com/in/(?P<linkedin>[a-zA-Z0-9_-]+)'
+    r'|(?P<demo>https?://[a-zA-Z0-9_-]+\.(?P<host>vercel\.app|netlify\.app|railway\.app|herokuapp\.com|streamlit\.app)[^\s\)]*)',
+    re.I,
+)
+
+# Path segments after github.com/ and twitter.com/ that are site pages, not users
+_GITHUB_NON_USERS = frozenset({"features", "explore", "topics", "trending", "collections"})
+_TWITTER_NON_USERS = frozenset({"home", "explore", "search", "intent"})
+
+# Kept separate: this phrase wraps URLs the link pattern also needs to see
+_WEBSITE_RE = re.compile(r'(?:my (?:site|website|portfolio)|check out)\s*:?\s*(https?://[^\s\)]+)', re.I)
+
+# At most this many demo URLs are kept per hosting platform
+_MAX_DEMOS_PER_HOST = 2
+
+# Reddit doesn't expose location directly, but sometimes users mention it.
+# The leading first-letter lookaheads let the engine reject most positions
+# before trying each alternative.
+_LOCATION_REGEXES = [
+    re.compile(r'\b(?=[bfl])(?:based in|from|living in|located in)\s+([A-Za-z\s,]+?)(?:\.|,|\s+and|\s+working)', re.I),
+    re.compile(r'\b(?=[snlabc])(SF|San Francisco|NYC|New York|LA|Los Angeles|Seattle|Austin|Boston|Chicago)\b', re.I),
+]
+
+# Engagement bonus by post score: below 5, 5+, 20+, 50+, 100+
+_POST_SCORE_TIERS = (5, 20, 50, 100)
+_POST_SCORE_BONUSES = (0.0, 0.05, 0.1, 0.15, 0.2)
+
+
+def _utc_iso(timestamp: float) -> str:
+    """Format epoch seconds as an ISO-8601 UTC string (no datetime objects)."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(timestamp))
+
 
 class RedditSource:
     """Crawls Reddit for vibe coding candidates via public JSON API."""
@@ -32,6 +75,9 @@ class RedditSource:
         "ClaudeAI",
     ]
 
+    # Subreddits searched with each query
+    QUERY_SUBREDDITS = ["SideProject", "startups", "indiehackers", "webdev"]
+
     # Search queries for vibe coding signals
     SEARCH_QUERIES = [
         "shipped my first",
@@ -49,11 +95,28 @@ class RedditSource:
         "built using GPT",
     ]
 
-    def __init__(self):
+    # Relevance keywords, each counted at most once per post
+    HIGH_SIGNAL_KEYWORDS = ("shipped", "launched", "built", "prototype", "mvp", "demo", "weekend project", "side project")
+    TOOL_KEYWORDS = ("cursor", "v0", "replit", "copilot", "langchain", "openai", "anthropic", "claude", "gpt", "llm")
+    FOUNDER_KEYWORDS = ("founder", "startup", "yc", "bootstrapped", "indie", "solopreneur")
+
+    # Flattened (keyword, weight) table scanned once per post
+    KEYWORD_WEIGHTS = (
+        tuple((kw, 0.15) for kw in HIGH_SIGNAL_KEYWORDS)
+        + tuple((kw, 0.1) for kw in TOOL_KEYWORDS)
+        + tuple((kw, 0.1) for kw in FOUNDER_KEYWORDS)
+    )
+
+    def __init__(self, max_workers: int = 8):
         self.base_url = "https://www.reddit.com"
+        self.max_workers = max_workers
         self.location_extractor = LocationExtractor()
         self._seen_authors: Set[str] = set()
 
+    def reset(self) -> None:
+        """Forget seen authors (for long-running processes)."""
+        self._seen_authors.clear()
+
     def _api_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """Make a request to Reddit's JSON API."""
         url = f"{self.base_url}{endpoint}.json"
@@ -70,7 +133,7 @@ class RedditSource:
                 headers=headers,
             )
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 logger.warning(f"Reddit API error {response.status_code}: {endpoint}")
                 return None
@@ -103,10 +166,13 @@ class RedditSource:
         for child in children[:limit]:
             post = child.get("data", {})
             if post.get("is_self", True):  # Self posts have more content
+                title = post.get("title", "")
+                selftext = post.get("selftext", "")
                 posts.append({
                     "id": post.get("id"),
-                    "title": post.get("title", ""),
-                    "selftext": post.get("selftext", ""),
+                    "title": title,
+                    "selftext": selftext,
+                    "full_text": f"{title} {selftext}",  # Shared by scoring and link extraction
                     "author": post.get("author"),
                     "subreddit": post.get("subreddit"),
                     "url": f"https://reddit.com{post.get('permalink', '')}",
@@ -150,80 +216,79 @@ class RedditSource:
         if not text:
             return result
 
-        # GitHub
-        gh_match = re.search(r'github\.com/([a-zA-Z0-9_-]+)', text, re.I)
-        if gh_match:
-            username = gh_match.group(1)
-            if username.lower() not in ("features", "explore", "topics", "trending", "collections"):
-                result["github_username"] = username
-
-        # Twitter/X
-        tw_match = re.search(r'(?:twitter|x)\.com/([a-zA-Z0-9_]+)', text, re.I)
-        if tw_match:
-            handle = tw_match.group(1)
-            if handle.lower() not in ("home", "explore", "search", "intent"):
-                result["twitter_handle"] = handle
-
-        # LinkedIn
-        li_match = re.search(r'linkedin\.com/in/([a-zA-Z0-9_-]+)', text, re.I)
-        if li_match:
-            result["linkedin_url"] = f"https://linkedin.com/in/{li_match.group(1)}"
-
-        # Demo/app URLs
-        demo_patterns = [
-            r'(https?://[a-zA-Z0-9_-]+\.vercel\.app[^\s\)]*)',
-            r'(https?://[a-zA-Z0-9_-]+\.netlify\.app[^\s\)]*)',
-            r'(https?://[a-zA-Z0-9_-]+\.railway\.app[^\s\)]*)',
-            r'(https?://[a-zA-Z0-9_-]+\.herokuapp\.com[^\s\)]*)',
-            r'(https?://[a-zA-Z0-9_-]+\.streamlit\.app[^\s\)]*)',
-        ]
-        for pattern in demo_patterns:
-            matches = re.findall(pattern, text, re.I)
-            result["demo_urls"].extend(matches[:2])
+        # Only the first GitHub/Twitter/LinkedIn mention counts; demos are capped per host
+        seen = set()
+        per_host: Dict[str, int] = {}
+        for match in _LINK_RE.finditer(text):
+            kind = match.lastgroup
+            if kind == "demo":
+                host = match.group("host").lower()
+                if per_host.get(host, 0) < _MAX_DEMOS_PER_HOST:
+                    per_host[host] = per_host.get(host, 0) + 1
+                    result["demo_urls"].append(match.group(0))
+                continue
+
+            if kind in seen:
+                continue
+            seen.add(kind)
+            value = match.group(kind)
+
+            if kind == "github":
+                if value.lower() not in _GITHUB_NON_USERS:
+                    result["github_username"] = value
+            elif kind == "twitter":
+                if value.lower() not in _TWITTER_NON_USERS:
+                    result["twitter_handle"] = value
+            else:
+                result["linkedin_url"] = f"https://linkedin.com/in/{value}"
 
         # Personal website (simple heuristic)
-        website_match = re.search(r'(?:my (?:site|website|portfolio)|check out)\s*:?\s*(https?://[^\s\)]+)', text, re.I)
+        website_match = _WEBSITE_RE.search(text)
         if website_match:
             result["website"] = website_match.group(1)
 
         return result
 
-    def _score_post_relevance(self, post: Dict) -> float:
-        """Score how relevant a post is for vibe coding signals."""
+    def _score_post_relevance(self, post: Dict, stop_at: float = 1.0) -> float:
+        """
+        Score how relevant a post is for vibe coding signals.
+
+        Keyword scanning stops once the score reaches stop_at (the cap by
+        default), so callers that only compare against a threshold can pass
+        it and skip the remaining scans; the result is then a lower bound.
+        """
         score = 0.0
-        text = f"{post.get('title', '')} {post.get('selftext', '')}".lower()
+        text = post["full_text"].lower()
 
-        # High-signal keywords
-        high_signal = ["shipped", "launched", "built", "prototype", "mvp", "demo", "weekend project", "side project"]
-        for kw in high_signal:
+        # Keyword signals
+        for kw, weight in self.KEYWORD_WEIGHTS:
             if kw in text:
-                score += 0.15
-
-        # Tool signals
-        tool_signals = ["cursor", "v0", "replit", "copilot", "langchain", "openai", "anthropic", "claude", "gpt", "llm"]
-        for tool in tool_signals:
-            if tool in text:
-                score += 0.1
-
-        # Founder signals
-        founder_signals = ["founder", "startup", "yc", "bootstrapped", "indie", "solopreneur"]
-        for signal in founder_signals:
-            if signal in text:
-                score += 0.1
+                score += weight
+                if score >= stop_at:
+                    return min(1.0, score)
 
         # Engagement bonus
-        post_score = post.get("score", 0)
-        if post_score >= 100:
-            score += 0.2
-        elif post_score >= 50:
-            score += 0.15
-        elif post_score >= 20:
-            score += 0.1
-        elif post_score >= 5:
-            score += 0.05
+        score += _POST_SCORE_BONUSES[bisect_right(_POST_SCORE_TIERS, post.get("score", 0))]
 
         return min(1.0, score)
 
+    def _eligible_posts(self, posts: List[Dict], min_relevance: float) -> List[Dict]:
+        """Filter posts to unseen authors whose post clears the relevance threshold."""
+        eligible = []
+        for post in posts:
+            author = post.get("author")
+            if not author or author in self._seen_authors or author == "[deleted]":
+                continue
+
+            self._seen_authors.add(author)
+
+            # Score relevance
+            if self._score_post_relevance(post, stop_at=min_relevance) < min_relevance:
+                continue
+
+            eligible.append(post)
+        return eligible
+
     def crawl(self, limit: int = 300) -> Generator[Candidate, None, None]:
         """
         Crawl Reddit for candidates.
@@ -239,71 +304,70 @@ class RedditSource:
 
         logger.info(f"Starting Reddit crawl with {len(self.SUBREDDITS)} subreddits, limit={limit}")
 
-        # First, search subreddits with queries
-        for query_idx, query in enumerate(self.SEARCH_QUERIES[:7]):  # Limit queries to avoid rate limits
-            if candidates_found >= limit:
-                break
-
-            log_progress(logger, query_idx + 1, min(7, len(self.SEARCH_QUERIES)), f"Query: {query[:30]}")
-
-            # Search across key subreddits
-            for subreddit in ["SideProject", "startups", "indiehackers", "webdev"]:
-                if candidates_found >= limit:
-                    break
-
-                posts = self.search_subreddit(subreddit, query=query, limit=10)
-
-                for post in posts:
-                    if candidates_found >= limit:
-                        break
+        queries = self.SEARCH_QUERIES[:7]  # Limit queries to avoid rate limits
+        query_searches = [
+            (query_idx, query, subreddit)
+            for query_idx, query in enumerate(queries)
+            for subreddit in self.QUERY_SUBREDDITS
+        ]
 
-                    author = post.get("author")
-                    if not author or author in self._seen_authors or author == "[deleted]":
-                        continue
+        if limit <= 0:
+            return
 
-                    self._seen_authors.add(author)
+        # Searches are independent, so overlap them, but only a window sized by the
+        # remaining limit ahead of what is consumed. Limit checks sit after each
+        # yield, so no extra search is pulled (or submitted) once the limit is reached.
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            # First, search subreddits with queries
+            results = windowed_map(
+                pool,
+                lambda search: self.search_subreddit(search[2], query=search[1], limit=10),
+                query_searches,
+                min(self.max_workers, -(-limit // 10)),
+            )
+            for (query_idx, query, subreddit), posts in zip(query_searches, results):
+                if subreddit == self.QUERY_SUBREDDITS[0]:
+                    log_progress(logger, query_idx + 1, len(queries), f"Query: {query[:30]}")
 
-                    # Score relevance
-                    relevance = self._score_post_relevance(post)
-                    if relevance < 0.2:
-                        continue
+                eligible = self._eligible_posts(posts, min_relevance=0.2)[:limit - candidates_found]
 
+                for post in eligible:
                     candidate = self._build_candidate(post)
                     if candidate:
                         candidates_found += 1
-                        log_progress(logger, candidates_found, limit, f"Found: u/{author}")
+                        log_progress(logger, candidates_found, limit, f"Found: u/{post['author']}")
                         yield candidate
 
-        # Then browse hot posts from key subreddits
-        for sub_idx, subreddit in enumerate(self.SUBREDDITS):
-            if candidates_found >= limit:
-                break
-
-            log_progress(logger, sub_idx + 1, len(self.SUBREDDITS), f"Subreddit: r/{subreddit}")
-
-            posts = self.search_subreddit(subreddit, limit=posts_per_subreddit)
-            logger.info(f"Found {len(posts)} posts in r/{subreddit}")
-
-            for post in posts:
                 if candidates_found >= limit:
                     break
 
-                author = post.get("author")
-                if not author or author in self._seen_authors or author == "[deleted]":
-                    continue
-
-                self._seen_authors.add(author)
-
-                # Score relevance
-                relevance = self._score_post_relevance(post)
-                if relevance < 0.25:  # Slightly higher threshold for non-search results
-                    continue
+            # Then browse hot posts from key subreddits
+            if candidates_found < limit:
+                hot_searches = windowed_map(
+                    pool,
+                    lambda subreddit: self.search_subreddit(subreddit, limit=posts_per_subreddit),
+                    self.SUBREDDITS,
+                    min(self.max_workers, -(-(limit - candidates_found) // posts_per_subreddit)),
+                )
+                for sub_idx, (subreddit, posts) in enumerate(zip(self.SUBREDDITS, hot_searches)):
+                    log_progress(logger, sub_idx + 1, len(self.SUBREDDITS), f"Subreddit: r/{subreddit}")
+                    logger.info(f"Found {len(posts)} posts in r/{subreddit}")
+
+                    # Slightly higher threshold for non-search results
+                    eligible = self._eligible_posts(posts, min_relevance=0.25)[:limit - candidates_found]
+
+                    for post in eligible:
+                        candidate = self._build_candidate(post)
+                        if candidate:
+                            candidates_found += 1
+                            log_progress(logger, candidates_found, limit, f"Found: u/{post['author']}")
+                            yield candidate
 
-                candidate = self._build_candidate(post)
-                if candidate:
-                    candidates_found += 1
-                    log_progress(logger, candidates_found, limit, f"Found: u/{author}")
-                    yield candidate
+                    if candidates_found >= limit:
+                        break
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
         logger.info(f"Reddit crawl complete. Found {candidates_found} candidates")
 
@@ -313,9 +377,6 @@ class RedditSource:
         if not author or author == "[deleted]":
             return None
 
-        # Get user info
-        user_info = self.get_user_info(author)
-
         # Build evidence from post
         evidence = []
         title = post.get("title", "")
@@ -329,28 +390,25 @@ class RedditSource:
             })
 
         if selftext:
-            # Get first meaningful paragraph
-            paragraphs = [p.strip() for p in selftext.split("\n\n") if p.strip()]
-            if paragraphs:
+            # Get first meaningful paragraph (leading whitespace skips empty ones)
+            body = selftext.lstrip()
+            end = body.find("\n\n")
+            first_paragraph = (body if end == -1 else body[:end]).strip()
+            if first_paragraph:
                 evidence.append({
-                    "text": paragraphs[0][:300],
+                    "text": first_paragraph[:300],
                     "url": post.get("url"),
                     "source": "reddit_post",
                 })
 
         # Extract links from post content
-        full_text = f"{title} {selftext}"
+        full_text = post["full_text"]
         extracted = self._extract_links_from_text(full_text)
 
         # Try to extract location from user profile or post
         location_text = None
-        # Reddit doesn't expose location directly, but sometimes users mention it
-        location_patterns = [
-            r'\b(?:based in|from|living in|located in)\s+([A-Za-z\s,]+?)(?:\.|,|\s+and|\s+working)',
-            r'\b(SF|San Francisco|NYC|New York|LA|Los Angeles|Seattle|Austin|Boston|Chicago)\b',
-        ]
-        for pattern in location_patterns:
-            match = re.search(pattern, full_text, re.I)
+        for pattern in _LOCATION_REGEXES:
+            match = pattern.search(full_text)
             if match:
                 location_text = match.group(1).strip()
                 break
@@ -360,6 +418,8 @@ class RedditSource:
             evidence_url=post.get("url"),
         )
 
+        created_utc = post.get("created_utc")
+
         candidate = Candidate(
             name=None,  # Reddit doesn't provide real names
             reddit_username=author,
@@ -377,7 +437,8 @@ class RedditSource:
             location_confidence=location_result.confidence,
             location_evidence_url=location_result.evidence_url,
             sources={"reddit"},
-            last_activity=datetime.fromtimestamp(post.get("created_utc", 0)).isoformat() if post.get("created_utc") else None,
+            last_activity=_utc_iso(created_utc) if created_utc else None,
+            last_activity_epoch=int(created_utc) if created_utc else None,
         )
 
         return candidate
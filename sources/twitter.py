@@ -3,8 +3,12 @@
 import os
 import re
 import base64
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Dict, Generator, List, Optional, Set
 
+import orjson
+
 from utils.rate_limit import rate_limited_request
 from utils.logging import get_logger, log_progress
 from utils.dedupe import Candidate
@@ -12,6 +16,29 @@ from extract.location_extract import LocationExtractor
 
 logger = get_logger(source="twitter")
 
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+_GITHUB_RE = re.compile(r'github\.com/([a-zA-Z0-9_-]+)', re.I)
+
+# Path segments after github.com/ that are site pages, not users
+_GITHUB_NON_USERS = frozenset({"features", "pricing", "enterprise"})
+
+# Engagement tiers: 10+ likes or 3+ retweets, then 50+ likes or 10+ retweets
+_LIKE_TIERS = (10, 50)
+_RETWEET_TIERS = (3, 10)
+_ENGAGEMENT_BONUSES = (0.0, 0.08, 0.15)
+
+
+@lru_cache(maxsize=2048)
+def _extract_github_cached(bio: str, url: str) -> Optional[str]:
+    """Extract a GitHub username from bio, then URL; memoized since profiles repeat across queries."""
+    for text in (bio, url):
+        match = _GITHUB_RE.search(text)
+        if match:
+            username = match.group(1)
+            if username.lower() not in _GITHUB_NON_USERS:
+                return username
+    return None
+
 
 class TwitterSource:
     """Crawls Twitter/X for vibe coding candidates using API v2."""
@@ -34,6 +61,18 @@ class TwitterSource:
         '"Claude" "built" "app" -is:retweet',
     ]
 
+    # Relevance keywords, each counted at most once per tweet
+    HIGH_SIGNAL_KEYWORDS = ("shipped", "launched", "built", "prototype", "mvp", "demo")
+    TOOL_KEYWORDS = ("cursor", "v0", "replit", "langchain", "openai", "claude", "gpt", "ai agent")
+    FOUNDER_KEYWORDS = ("founder", "yc", "startup", "ceo", "cto")
+
+    # Flattened (keyword, weight) table scanned once per tweet
+    KEYWORD_WEIGHTS = (
+        tuple((kw, 0.12) for kw in HIGH_SIGNAL_KEYWORDS)
+        + tuple((kw, 0.1) for kw in TOOL_KEYWORDS)
+        + tuple((kw, 0.08) for kw in FOUNDER_KEYWORDS)
+    )
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -50,8 +89,14 @@ class TwitterSource:
         self.base_url = "https://api.twitter.com/2"
         self.location_extractor = LocationExtractor()
         self._seen_users: Set[str] = set()
+        self._user_cache: Dict[str, Dict] = {}
         self._bearer_token: Optional[str] = None
 
+    def reset(self) -> None:
+        """Forget seen users and cached profiles (for long-running processes)."""
+        self._seen_users.clear()
+        self._user_cache.clear()
+
     def _get_bearer_token(self) -> Optional[str]:
         """Get OAuth 2.0 Bearer token using API key and secret."""
         if self._bearer_token:
@@ -115,7 +160,7 @@ class TwitterSource:
             )
 
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             elif response.status_code == 429:
                 logger.warning("Twitter rate limit hit")
                 return None
@@ -171,13 +216,17 @@ class TwitterSource:
         return results
 
     def get_user(self, username: str) -> Optional[Dict]:
-        """Get user profile by username."""
+        """Get user profile by username (memoized per source instance)."""
+        if username in self._user_cache:
+            return self._user_cache[username]
+
         params = {
             "user.fields": "name,username,description,location,url,public_metrics,verified,created_at",
         }
 
         data = self._api_request(f"/users/by/username/{username}", params)
         if data and "data" in data:
+            self._user_cache[username] = data["data"]
             return data["data"]
         return None
 
@@ -189,58 +238,30 @@ class TwitterSource:
         text = tweet.get("text", "")
 
         # Find URLs in text
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        matches = re.findall(url_pattern, text)
+        matches = _URL_RE.findall(text)
         links.extend(matches)
 
         return list(set(links))
 
     def _extract_github_from_bio(self, bio: str, url: str = None) -> Optional[str]:
         """Extract GitHub username from bio or URL."""
-        texts = [bio or ""]
-        if url:
-            texts.append(url)
-
-        for text in texts:
-            match = re.search(r'github\.com/([a-zA-Z0-9_-]+)', text, re.I)
-            if match:
-                username = match.group(1)
-                if username.lower() not in ["features", "pricing", "enterprise"]:
-                    return username
-        return None
+        return _extract_github_cached(bio or "", url or "")
 
     def _score_tweet_relevance(self, tweet: Dict) -> float:
         """Score how relevant a tweet is for vibe coding signals."""
         score = 0.0
         text = tweet.get("text", "").lower()
 
-        # High-signal keywords
-        high_signal = ["shipped", "launched", "built", "prototype", "mvp", "demo"]
-        for kw in high_signal:
-            if kw in text:
-                score += 0.12
-
-        # Tool signals
-        tools = ["cursor", "v0", "replit", "langchain", "openai", "claude", "gpt", "ai agent"]
-        for tool in tools:
-            if tool in text:
-                score += 0.1
-
-        # Founder signals
-        founder_signals = ["founder", "yc", "startup", "ceo", "cto"]
-        for signal in founder_signals:
-            if signal in text:
-                score += 0.08
-
-        # Engagement bonus
-        metrics = tweet.get("metrics", {})
-        likes = metrics.get("like_count", 0)
-        retweets = metrics.get("retweet_count", 0)
+        # Keyword signals
+        score += sum(weight for kw, weight in self.KEYWORD_WEIGHTS if kw in text)
 
-        if likes >= 50 or retweets >= 10:
-            score += 0.15
-        elif likes >= 10 or retweets >= 3:
-            score += 0.08
+        # Engagement bonus: the higher tier reached by either likes or retweets
+        metrics = tweet.get("metrics", {})
+        tier = max(
+            bisect_right(_LIKE_TIERS, metrics.get("like_count", 0)),
+            bisect_right(_RETWEET_TIERS, metrics.get("retweet_count", 0)),
+        )
+        score += _ENGAGEMENT_BONUSES[tier]
 
         return min(1.0, score)
 
@@ -263,6 +284,8 @@ class TwitterSource:
 
         logger.info(f"Starting Twitter crawl with {total_queries} queries, limit={limit}")
 
+        # Queries run one at a time: search quota is tiny on lower API tiers, so a
+        # query is only spent once the previous ones failed to reach the limit
         for query_idx, query in enumerate(self.SEARCH_QUERIES):
             if candidates_found >= limit:
                 break
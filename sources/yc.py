@@ -1,9 +1,14 @@
 """YC Directory source crawler for Inactive/Acquired companies."""
 
+import asyncio
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Generator, List, Optional, Set
 
+import lxml.html
+import orjson
+
 from utils.rate_limit import rate_limited_request
 from utils.logging import get_logger, log_progress
 from utils.dedupe import Candidate
@@ -11,6 +16,174 @@ from extract.location_extract import LocationExtractor
 
 logger = get_logger(source="yc")
 
+_LINKEDIN_RE = re.compile(r"linkedin\.com/in/([^/\?]+)")
+_TWITTER_RE = re.compile(r"(?:twitter\.com|x\.com)/([^/\?]+)")
+
+# Installed once per browser context as window.__extractFounders(); finds founders
+# by their LinkedIn profile links and the surrounding context
+_FOUNDER_EXTRACTOR_JS = """
+window.__extractFounders = () => {
+    const founders = [];
+    const seen = new Set();
+
+    // Find all LinkedIn profile links (not company pages)
+    for (const link of document.querySelectorAll('a[href*="linkedin.com/in/"]')) {
+        // Skip if we've already processed this LinkedIn URL
+        if (seen.has(link.href)) continue;
+        seen.add(link.href);
+
+        // Walk up the DOM to find the name
+        const container = link.closest('div');
+        let parent = container;
+        let name = null;
+        let title = null;
+
+        for (let i = 0; i < 5 && parent; i++) {
+            const text = parent.innerText || '';
+            const lines = text.split('\\n').filter(l => l.trim());
+
+            // First line is likely the name if it's reasonable length
+            if (lines[0] && lines[0].length < 50 && lines[0].length > 2) {
+                name = lines[0].trim();
+                // Second line might be title
+                if (lines[1] && lines[1].length < 100) {
+                    title = lines[1].trim();
+                }
+                break;
+            }
+            parent = parent.parentElement;
+        }
+
+        if (!name) continue;
+
+        // Check for Twitter link nearby
+        const twitterLink = container?.querySelector('a[href*="twitter.com"], a[href*="x.com"]');
+
+        founders.push({
+            name: name,
+            title: title,
+            linkedin: link.href,
+            twitter: twitterLink ? twitterLink.href : null,
+        });
+    }
+
+    return founders;
+};
+"""
+
+
+# innerText approximation for static HTML: text under these tags is never
+# rendered, and these tags start and end a line
+_NON_RENDERED_TAGS = frozenset({"script", "style", "noscript", "template", "head", "title"})
+_BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "dd", "details", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5",
+    "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "summary",
+    "table", "td", "th", "tr", "ul",
+})
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _is_hidden(element) -> bool:
+    """Whether an element is hidden via the hidden attribute or inline display:none."""
+    if element.get("hidden") is not None:
+        return True
+    style = element.get("style")
+    return bool(style) and "display:none" in style.replace(" ", "").lower()
+
+
+def _inner_text_lines(element) -> List[str]:
+    """Non-empty text lines of an element, approximating the browser's innerText."""
+    parts = []
+
+    def walk(node) -> None:
+        tag = node.tag
+        # Comments and processing instructions have a non-string tag
+        if not isinstance(tag, str) or tag in _NON_RENDERED_TAGS or _is_hidden(node):
+            return
+        if tag == "br":
+            parts.append("\n")
+            return
+        block = tag in _BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        if node.text:
+            parts.append(_WHITESPACE_RE.sub(" ", node.text))
+        for child in node:
+            walk(child)
+            if child.tail:
+                parts.append(_WHITESPACE_RE.sub(" ", child.tail))
+        if block:
+            parts.append("\n")
+
+    walk(element)
+    return [line.strip() for line in "".join(parts).split("\n") if line.strip()]
+
+
+def _parse_founders_html(html: str) -> List[Dict]:
+    """
+    Extract founders from server-rendered company page HTML.
+
+    Follows the in-browser extraction: each LinkedIn profile link is paired
+    with the first short text line of its nearest enclosing div. Lines come
+    from an innerText approximation (script/style and hidden nodes skipped,
+    breaks at block elements and <br>), so CSS-driven layout can still make
+    the result differ from the browser path in rare cases.
+    """
+    try:
+        tree = lxml.html.fromstring(html)
+    except (lxml.etree.ParserError, ValueError):
+        return []
+
+    founders = []
+    seen = set()
+
+    for link in tree.xpath('//a[contains(@href, "linkedin.com/in/")]'):
+        href = link.get("href", "")
+        if href in seen:
+            continue
+        seen.add(href)
+
+        block = next(link.iterancestors("div"), None)
+        parent = block
+        name = None
+        title = None
+
+        for _ in range(5):
+            if parent is None:
+                break
+            lines = _inner_text_lines(parent)
+
+            # First line is likely the name if it's reasonable length
+            if lines and 2 < len(lines[0]) < 50:
+                name = lines[0]
+                # Second line might be title
+                if len(lines) > 1 and len(lines[1]) < 100:
+                    title = lines[1]
+                break
+            parent = parent.getparent()
+
+        if not name:
+            continue
+
+        # Check for Twitter link nearby
+        twitter = None
+        if block is not None:
+            twitter_links = block.xpath(
+                './/a[contains(@href, "twitter.com") or contains(@href, "x.com")]/@href'
+            )
+            if twitter_links:
+                twitter = twitter_links[0]
+
+        founders.append({
+            "name": name,
+            "title": title,
+            "linkedin": href,
+            "twitter": twitter,
+        })
+
+    return founders
+
 
 class YCSource:
     """Crawls YC Directory for founders of Inactive/Acquired companies."""
@@ -24,23 +197,36 @@ class YCSource:
     # Status values we're interested in
     TARGET_STATUSES = {"Inactive", "Acquired"}
 
+    # Founder blocks are in the first paint; don't wait on analytics/assets
+    NAVIGATION_TIMEOUT_MS = 5000
+    FOUNDER_SELECTOR_TIMEOUT_MS = 3000
+    FOUNDER_LINK_SELECTOR = 'a[href*="linkedin.com/in/"]'
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+    VIEWPORT = {"width": 800, "height": 600}
+
     def __init__(
         self,
         use_browser: bool = True,
         max_companies: int = 0,  # 0 = no limit
+        max_pages: int = 8,
     ):
         """
         Initialize YC source.
 
         Args:
-            use_browser: Whether to use Playwright for JS rendering
+            use_browser: Whether to scrape company pages (static HTML first,
+                Playwright for pages that need JS rendering)
             max_companies: Maximum companies to process (0 = no limit)
+            max_pages: Company pages fetched concurrently per batch
         """
         self.use_browser = use_browser
         self.max_companies = max_companies
+        self.max_pages = max(1, max_pages)
         self.location_extractor = LocationExtractor()
+        self._browser_failed = False
+        self._loop = None
+        self._playwright = None
         self._browser = None
-        self._page = None
 
     def _fetch_companies(self) -> List[Dict]:
         """Fetch all companies from YC OSS API."""
@@ -56,22 +242,22 @@ class YCSource:
                 logger.error(f"Failed to fetch YC companies: {response.status_code}")
                 return []
 
-            companies = response.json()
+            companies = orjson.loads(response.content)
             logger.info(f"Fetched {len(companies)} total companies from YC API")
 
-            # Filter to target statuses
-            filtered = [
-                c for c in companies
-                if c.get("status") in self.TARGET_STATUSES
-            ]
+            # Filter to target statuses in one pass, stopping at max_companies if set
+            target_statuses = self.TARGET_STATUSES
+            limit = self.max_companies
+            filtered = []
+            for c in companies:
+                if c.get("status") in target_statuses:
+                    filtered.append(c)
+                    if len(filtered) == limit:
+                        break
 
             logger.info(
-                f"Found {len(filtered)} companies with status in {self.TARGET_STATUSES}"
+                f"Selected {len(filtered)} companies with status in {target_statuses}"
             )
-
-            # Apply max_companies limit if set
-            if self.max_companies > 0:
-                return filtered[:self.max_companies]
             return filtered
 
         except Exception as e:
@@ -79,16 +265,18 @@ class YCSource:
             return []
 
     def _init_browser(self):
-        """Initialize Playwright browser."""
+        """Initialize Playwright browser on a private event loop."""
         if self._browser is not None:
             return
 
         try:
-            from playwright.sync_api import sync_playwright
+            from playwright.async_api import async_playwright
 
-            self._playwright = sync_playwright().start()
-            self._browser = self._playwright.chromium.launch(headless=True)
-            self._page = self._browser.new_page()
+            self._loop = asyncio.new_event_loop()
+            self._playwright = self._loop.run_until_complete(async_playwright().start())
+            self._browser = self._loop.run_until_complete(
+                self._playwright.chromium.launch(headless=True)
+            )
             logger.info("Playwright browser initialized")
 
         except ImportError:
@@ -103,14 +291,64 @@ class YCSource:
     def _close_browser(self):
         """Close Playwright browser."""
         if self._browser:
-            self._browser.close()
-            self._playwright.stop()
+            self._loop.run_until_complete(self._browser.close())
+            self._loop.run_until_complete(self._playwright.stop())
+            self._loop.close()
             self._browser = None
-            self._page = None
+            self._playwright = None
+            self._loop = None
 
-    def _scrape_company_page(self, company: Dict) -> List[Dict]:
+    def _scrape_static(self, company: Dict) -> List[Dict]:
+        """Scrape founders from the company page's static HTML (no browser)."""
+        slug = company.get("slug")
+        if not slug:
+            return []
+
+        url = f"{self.COMPANY_PAGE_BASE}{slug}"
+
+        try:
+            response = rate_limited_request(
+                source="yc",
+                method="GET",
+                url=url,
+                timeout=10,
+            )
+            if response.status_code != 200:
+                return []
+            return _parse_founders_html(response.text)
+        except Exception as e:
+            logger.debug(f"Static fetch failed for {url}: {e}")
+            return []
+
+    def _scrape_browser(self, companies: List[Dict]) -> List[List[Dict]]:
+        """Scrape companies with Playwright, starting the browser on first use."""
+        if self._browser is None and not self._browser_failed:
+            try:
+                self._init_browser()
+            except Exception as e:
+                logger.warning(f"Browser init failed, using static HTML and API data only: {e}")
+                self._browser_failed = True
+
+        if self._browser is None:
+            return [[] for _ in companies]
+        return self._scrape_batch(companies)
+
+    def _scrape_batch(self, companies: List[Dict]) -> List[List[Dict]]:
+        """Scrape a batch of company pages concurrently, preserving input order."""
+        return self._loop.run_until_complete(
+            asyncio.gather(*(self._scrape_company_page(c) for c in companies))
+        )
+
+    async def _route_request(self, route) -> None:
+        """Abort asset requests (by resource type) that play no part in founder extraction."""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _scrape_company_page(self, company: Dict) -> List[Dict]:
         """
-        Scrape founder info from YC company page.
+        Scrape founder info from YC company page in its own browser context.
 
         Args:
             company: Company dict from API
@@ -124,62 +362,33 @@ class YCSource:
 
         url = f"{self.COMPANY_PAGE_BASE}{slug}"
 
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        context = None
         try:
-            self._page.goto(url, wait_until="networkidle", timeout=15000)
-
-            # Extract founders by finding LinkedIn profile links and their surrounding context
-            founders = self._page.evaluate("""
-                () => {
-                    const founders = [];
-                    const seen = new Set();
-
-                    // Find all LinkedIn profile links (not company pages)
-                    document.querySelectorAll('a[href*="linkedin.com/in/"]').forEach(link => {
-                        // Skip if we've already processed this LinkedIn URL
-                        if (seen.has(link.href)) return;
-                        seen.add(link.href);
-
-                        // Walk up the DOM to find the name
-                        let parent = link.closest('div');
-                        let name = null;
-                        let title = null;
-
-                        for (let i = 0; i < 5 && parent; i++) {
-                            const text = parent.innerText || '';
-                            const lines = text.split('\\n').filter(l => l.trim());
-
-                            // First line is likely the name if it's reasonable length
-                            if (lines[0] && lines[0].length < 50 && lines[0].length > 2) {
-                                name = lines[0].trim();
-                                // Second line might be title
-                                if (lines[1] && lines[1].length < 100) {
-                                    title = lines[1].trim();
-                                }
-                                break;
-                            }
-                            parent = parent.parentElement;
-                        }
-
-                        if (name) {
-                            // Check for Twitter link nearby
-                            let twitter = null;
-                            const twitterLink = link.closest('div')?.querySelector('a[href*="twitter.com"], a[href*="x.com"]');
-                            if (twitterLink) {
-                                twitter = twitterLink.href;
-                            }
-
-                            founders.push({
-                                name: name,
-                                title: title,
-                                linkedin: link.href,
-                                twitter: twitter,
-                            });
-                        }
-                    });
-
-                    return founders;
-                }
-            """)
+            context = await self._browser.new_context(viewport=self.VIEWPORT)
+            context.set_default_navigation_timeout(self.NAVIGATION_TIMEOUT_MS)
+            await context.route("**/*", self._route_request)
+            await context.add_init_script(_FOUNDER_EXTRACTOR_JS)
+            page = await context.new_page()
+
+            # Only need the response committed; the selector wait below covers rendering
+            try:
+                await page.goto(url, wait_until="commit")
+            except PlaywrightTimeoutError:
+                pass
+
+            try:
+                await page.wait_for_selector(
+                    self.FOUNDER_LINK_SELECTOR,
+                    timeout=self.FOUNDER_SELECTOR_TIMEOUT_MS,
+                )
+            except PlaywrightTimeoutError:
+                # No founder links rendered; caller falls back to API data
+                logger.debug(f"No founder links on {url}")
+                return []
+
+            founders = await page.evaluate("() => window.__extractFounders()")
 
             logger.debug(f"Found {len(founders)} founders for {company.get('name')}")
             return founders
@@ -188,6 +397,13 @@ class YCSource:
             logger.debug(f"Failed to scrape {url}: {e}")
             return []
 
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+
     def _extract_founders_from_api(self, company: Dict) -> List[Dict]:
         """
         Extract founder info from API data (limited info available).
@@ -225,7 +441,7 @@ class YCSource:
         linkedin_url = founder.get("linkedin")
         linkedin_username = None
         if linkedin_url:
-            match = re.search(r"linkedin\.com/in/([^/\?]+)", linkedin_url)
+            match = _LINKEDIN_RE.search(linkedin_url)
             if match:
                 linkedin_username = match.group(1)
 
@@ -233,7 +449,7 @@ class YCSource:
         twitter_handle = None
         twitter_url = founder.get("twitter")
         if twitter_url:
-            match = re.search(r"(?:twitter\.com|x\.com)/([^/\?]+)", twitter_url)
+            match = _TWITTER_RE.search(twitter_url)
             if match:
                 twitter_handle = match.group(1)
 
@@ -320,57 +536,61 @@ class YCSource:
         candidates_found = 0
         seen_names: Set[str] = set()
 
-        # Initialize browser if needed
-        if self.use_browser:
-            try:
-                self._init_browser()
-            except Exception as e:
-                logger.warning(f"Browser init failed, using API-only mode: {e}")
-                self.use_browser = False
+        pool = ThreadPoolExecutor(max_workers=self.max_pages)
 
         try:
-            for idx, company in enumerate(companies):
+            for start in range(0, len(companies), self.max_pages):
                 if candidates_found >= limit:
                     break
 
-                log_progress(
-                    logger, idx + 1, len(companies),
-                    f"Processing: {company.get('name', 'Unknown')}"
-                )
-
-                # Try to get founders
-                founders = []
+                batch = companies[start:start + self.max_pages]
 
-                # First try browser scraping
+                # Static HTML first; only pages it misses go to the browser
                 if self.use_browser:
-                    founders = self._scrape_company_page(company)
-
-                # Fallback to API data
-                if not founders:
-                    founders = self._extract_founders_from_api(company)
-
-                # Build candidates from founders
-                for founder in founders:
+                    scraped = list(pool.map(self._scrape_static, batch))
+                    misses = [i for i, founders in enumerate(scraped) if not founders]
+                    if misses:
+                        rendered = self._scrape_browser([batch[i] for i in misses])
+                        for i, founders in zip(misses, rendered):
+                            scraped[i] = founders
+                else:
+                    scraped = [[] for _ in batch]
+
+                for offset, (company, founders) in enumerate(zip(batch, scraped)):
                     if candidates_found >= limit:
                         break
 
-                    name = founder.get("name")
-                    if not name or name in seen_names:
-                        continue
+                    log_progress(
+                        logger, start + offset + 1, len(companies),
+                        f"Processing: {company.get('name', 'Unknown')}"
+                    )
+
+                    # Fallback to API data
+                    if not founders:
+                        founders = self._extract_founders_from_api(company)
+
+                    # Build candidates from founders
+                    for founder in founders:
+                        if candidates_found >= limit:
+                            break
+
+                        name = founder.get("name")
+                        if not name or name in seen_names:
+                            continue
 
-                    seen_names.add(name)
+                        seen_names.add(name)
 
-                    candidate = self._build_candidate(founder, company)
-                    if candidate:
-                        candidates_found += 1
-                        log_progress(
-                            logger, candidates_found, limit,
-                            f"Found: {name} ({company.get('name')})"
-                        )
-                        yield candidate
+                        candidate = self._build_candidate(founder, company)
+                        if candidate:
+                            candidates_found += 1
+                            log_progress(
+                                logger, candidates_found, limit,
+                                f"Found: {name} ({company.get('name')})"
+                            )
+                            yield candidate
 
         finally:
-            if self.use_browser:
-                self._close_browser()
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._close_browser()
 
         logger.info(f"YC crawl complete. Found {candidates_found} candidates")
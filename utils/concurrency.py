@@ -0,0 +1,36 @@
+"""Thread pool helpers for crawlers."""
+
+from collections import deque
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def windowed_map(
+    pool: Executor,
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    window: int,
+) -> Iterator[R]:
+    """
+    Like pool.map, but keeps at most `window` calls submitted ahead of the consumer.
+
+    Results come back in input order. A new call is only submitted when the
+    consumer takes a result, so a caller that stops iterating (e.g. once a
+    candidate limit is reached) stops issuing requests; calls not yet
+    started are cancelled when the iterator is closed.
+    """
+    items = iter(items)
+    pending = deque(pool.submit(fn, item) for item in islice(items, max(1, window)))
+    try:
+        while pending:
+            future = pending.popleft()
+            for item in islice(items, 1):
+                pending.append(pool.submit(fn, item))
+            yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
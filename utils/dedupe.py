@@ -1,14 +1,37 @@
 """Candidate deduplication and identity linking."""
 
 import re
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, field
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field, fields
 from difflib import SequenceMatcher
 
+_LINKEDIN_IN_RE = re.compile(r"linkedin\.com/in/([a-zA-Z0-9_-]+)", re.I)
+_DOMAIN_RE = re.compile(r"https?://(?:www\.)?([^/]+)")
+_NAME_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
-@dataclass
+# Common platforms that don't identify individuals
+_SKIP_DOMAINS = frozenset({
+    "github.com", "twitter.com", "x.com", "linkedin.com",
+    "medium.com", "substack.com", "youtube.com",
+})
+
+
+def parse_iso_epoch(value: Optional[str]) -> Optional[int]:
+    """Parse an ISO-8601 timestamp into epoch seconds (None if unparseable)."""
+    if not value:
+        return None
+    try:
+        return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+@dataclass(slots=True)
 class Candidate:
-    """Represents a discovered candidate."""
+    """Represents a discovered candidate (slotted: no per-instance __dict__)."""
 
     # Identity
     id: str = ""  # Generated unique ID
@@ -23,8 +46,10 @@ class Candidate:
     # Links
     github_url: Optional[str] = None
     website: Optional[str] = None
-    demo_urls: List[str] = field(default_factory=list)
-    source_urls: List[str] = field(default_factory=list)
+    # URL -> None, so merges stay O(new) and sources' priority order is kept;
+    # lists from sources are coerced
+    demo_urls: Dict[str, None] = field(default_factory=dict)
+    source_urls: Dict[str, None] = field(default_factory=dict)
 
     # Bio and evidence
     bio: Optional[str] = None
@@ -40,6 +65,7 @@ class Candidate:
     # Metadata
     sources: Set[str] = field(default_factory=set)  # github, hn, brave, etc.
     last_activity: Optional[str] = None
+    last_activity_epoch: Optional[int] = None  # Parsed once from last_activity
     stars_total: int = 0
     repo_count: int = 0
 
@@ -48,9 +74,37 @@ class Candidate:
     total_score: float = 0.0
     recruiter_pitch: Optional[str] = None
 
+    # (text, url, source) of each evidence snippet, so merges skip repeats; not serialized
+    _evidence_keys: Set[Tuple[str, str, str]] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    # Lazily built comparison sets for the deduper; cleared by merge_from
+    _handle_cache: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    _demo_domain_cache: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    _identifier_cache: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
+        if not isinstance(self.demo_urls, dict):
+            self.demo_urls = dict.fromkeys(self.demo_urls)
+        if not isinstance(self.source_urls, dict):
+            self.source_urls = dict.fromkeys(self.source_urls)
         if not self.id:
             self.id = self._generate_id()
+        if self.last_activity_epoch is None:
+            self.last_activity_epoch = parse_iso_epoch(self.last_activity)
+        self._evidence_keys = {self._evidence_key(ev) for ev in self.evidence_snippets}
+
+    @staticmethod
+    def _evidence_key(snippet: Dict) -> Tuple[str, str, str]:
+        """Identity of an evidence snippet for duplicate detection."""
+        return (snippet.get("text", ""), snippet.get("url", ""), snippet.get("source", ""))
+
+    def add_evidence(self, snippet: Dict) -> None:
+        """Append an evidence snippet unless an identical one is already recorded."""
+        key = self._evidence_key(snippet)
+        if key not in self._evidence_keys:
+            self._evidence_keys.add(key)
+            self.evidence_snippets.append(snippet)
 
     def _generate_id(self) -> str:
         """Generate a unique ID based on available identifiers."""
@@ -67,18 +121,63 @@ class Candidate:
         if self.email:
             return f"email:{self.email.lower()}"
         if self.name:
-            slug = re.sub(r"[^a-z0-9]+", "-", self.name.lower()).strip("-")
+            slug = _NAME_SLUG_RE.sub("-", self.name.lower()).strip("-")
             return f"name:{slug}"
         return f"unknown:{id(self)}"
 
+    def _identity_fields(self) -> tuple:
+        """Fields _generate_id reads, in priority order."""
+        return (
+            self.github_username, self.hn_username, self.reddit_username,
+            self.website, self.email, self.name,
+        )
+
     @staticmethod
     def _extract_domain(url: str) -> Optional[str]:
         """Extract domain from URL."""
-        match = re.search(r"https?://(?:www\.)?([^/]+)", url)
+        match = _DOMAIN_RE.search(url)
         return match.group(1) if match else None
 
+    @property
+    def handle_set(self) -> frozenset:
+        """Lowercased GitHub/HN/Twitter handles (cached)."""
+        if self._handle_cache is None:
+            self._handle_cache = frozenset(
+                h.lower() for h in (self.github_username, self.hn_username, self.twitter_handle) if h
+            )
+        return self._handle_cache
+
+    @property
+    def demo_domains(self) -> frozenset:
+        """Identifying domains of the demo URLs (cached; platform domains excluded)."""
+        if self._demo_domain_cache is None:
+            self._demo_domain_cache = frozenset(
+                d for d in map(_identifying_domain, filter(None, self.demo_urls)) if d
+            )
+        return self._demo_domain_cache
+
+    @property
+    def identifier_set(self) -> frozenset:
+        """(kind, lowercased value) pairs for GitHub, HN, Twitter, email and LinkedIn (cached)."""
+        if self._identifier_cache is None:
+            linkedin = _linkedin_username(self.linkedin_url) if self.linkedin_url else None
+            self._identifier_cache = frozenset(
+                (kind, value.lower())
+                for kind, value in (
+                    ("gh", self.github_username),
+                    ("hn", self.hn_username),
+                    ("tw", self.twitter_handle),
+                    ("em", self.email),
+                    ("li", linkedin),
+                )
+                if value
+            )
+        return self._identifier_cache
+
     def merge_from(self, other: "Candidate") -> None:
         """Merge another candidate's data into this one."""
+        identity = self._identity_fields()
+
         # Prefer non-None values
         if other.name and not self.name:
             self.name = other.name
@@ -100,7 +199,15 @@ class Candidate:
             self.website = other.website
         if other.bio and (not self.bio or len(other.bio) > len(self.bio)):
             self.bio = other.bio
-        if other.location_raw and other.location_confidence > self.location_confidence:
+        # Take the more confident location; on a tie, prefer one that resolved to a metro bucket
+        if other.location_raw and (
+            other.location_confidence > self.location_confidence
+            or (
+                other.location_confidence == self.location_confidence
+                and self.metro_bucket == "UNKNOWN"
+                and other.metro_bucket != "UNKNOWN"
+            )
+        ):
             self.location_raw = other.location_raw
             self.country = other.country
             self.metro_bucket = other.metro_bucket
@@ -108,9 +215,10 @@ class Candidate:
             self.location_evidence_url = other.location_evidence_url
 
         # Merge lists
-        self.demo_urls = list(set(self.demo_urls + other.demo_urls))
-        self.source_urls = list(set(self.source_urls + other.source_urls))
-        self.evidence_snippets.extend(other.evidence_snippets)
+        self.demo_urls.update(other.demo_urls)
+        self.source_urls.update(other.source_urls)
+        for snippet in other.evidence_snippets:
+            self.add_evidence(snippet)
         self.sources.update(other.sources)
 
         # Take max values
@@ -118,12 +226,18 @@ class Candidate:
         self.repo_count = max(self.repo_count, other.repo_count)
 
         # Keep most recent activity
-        if other.last_activity:
-            if not self.last_activity or other.last_activity > self.last_activity:
+        if other.last_activity_epoch is not None:
+            if self.last_activity_epoch is None or other.last_activity_epoch > self.last_activity_epoch:
                 self.last_activity = other.last_activity
+                self.last_activity_epoch = other.last_activity_epoch
 
-        # Regenerate ID with new info
-        self.id = self._generate_id()
+        # Regenerate ID only if an identifying field was filled in
+        if self._identity_fields() != identity:
+            self.id = self._generate_id()
+
+        self._handle_cache = None
+        self._demo_domain_cache = None
+        self._identifier_cache = None
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
@@ -138,8 +252,8 @@ class Candidate:
             "twitter_handle": self.twitter_handle,
             "github_url": self.github_url,
             "website": self.website,
-            "demo_urls": self.demo_urls,
-            "source_urls": self.source_urls,
+            "demo_urls": list(self.demo_urls),
+            "source_urls": list(self.source_urls),
             "bio": self.bio,
             "evidence_snippets": self.evidence_snippets,
             "location_raw": self.location_raw,
@@ -149,6 +263,7 @@ class Candidate:
             "location_evidence_url": self.location_evidence_url,
             "sources": list(self.sources),
             "last_activity": self.last_activity,
+            "last_activity_epoch": self.last_activity_epoch,
             "stars_total": self.stars_total,
             "repo_count": self.repo_count,
             "scores": self.scores,
@@ -158,21 +273,40 @@ class Candidate:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "Candidate":
-        """Create from dictionary."""
-        data = data.copy()
+        """Create from dictionary (keys that aren't init fields are ignored)."""
+        init_fields = {f.name for f in fields(cls) if f.init}
+        data = {k: v for k, v in data.items() if k in init_fields}
         data["sources"] = set(data.get("sources", []))
         data["evidence_snippets"] = data.get("evidence_snippets", [])
-        data["demo_urls"] = data.get("demo_urls", [])
-        data["source_urls"] = data.get("source_urls", [])
+        data["demo_urls"] = dict.fromkeys(data.get("demo_urls", []))
+        data["source_urls"] = dict.fromkeys(data.get("source_urls", []))
         data["scores"] = data.get("scores", {})
         return cls(**data)
 
 
+@lru_cache(maxsize=4096)
+def _linkedin_username(url: str) -> Optional[str]:
+    """Lowercased LinkedIn username from a profile URL (memoized; URLs recur across scans)."""
+    match = _LINKEDIN_IN_RE.search(url)
+    return match.group(1).lower() if match else None
+
+
+@lru_cache(maxsize=4096)
+def _identifying_domain(url: str) -> Optional[str]:
+    """Lowercased domain of a URL, or None for platforms that don't identify a person."""
+    match = _DOMAIN_RE.search(url)
+    if not match:
+        return None
+    domain = match.group(1).lower()
+    return None if domain in _SKIP_DOMAINS else domain
+
+
 class CandidateDeduper:
     """Deduplicates and merges candidates across sources."""
 
-    def __init__(self, similarity_threshold: float = 0.85):
+    def __init__(self, similarity_threshold: float = 0.85, name_block_limit: int = 256):
         self.similarity_threshold = similarity_threshold
+        self.name_block_limit = name_block_limit
         self.candidates: Dict[str, Candidate] = {}  # id -> Candidate
         self._github_index: Dict[str, str] = {}  # github_username -> id
         self._hn_index: Dict[str, str] = {}  # hn_username -> id
@@ -181,6 +315,9 @@ class CandidateDeduper:
         self._linkedin_index: Dict[str, str] = {}  # linkedin_url -> id
         self._domain_index: Dict[str, str] = {}  # domain -> id
         self._email_index: Dict[str, str] = {}  # email -> id
+        # first/last name token -> {id: normalized name}, so similarity is only scored within
+        # a block; each block is kept in least- to most-recently-touched order and capped
+        self._name_block_index: Dict[str, "OrderedDict[str, str]"] = defaultdict(OrderedDict)
 
     def add(self, candidate: Candidate) -> Candidate:
         """Add a candidate, merging if duplicate found."""
@@ -189,13 +326,48 @@ class CandidateDeduper:
         if existing_id:
             existing = self.candidates[existing_id]
             existing.merge_from(candidate)
-            self._update_indices(existing)
+            self._update_indices(existing, existing_id)
+            self._index_name(existing_id, existing.name)
             return existing
         else:
             self.candidates[candidate.id] = candidate
-            self._update_indices(candidate)
+            self._update_indices(candidate, candidate.id)
+            self._index_name(candidate.id, candidate.name)
             return candidate
 
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        """Lowercased, stripped name as compared by _name_similarity."""
+        return name.lower().strip()
+
+    @staticmethod
+    def _name_blocks(normalized_name: str) -> Set[str]:
+        """Blocking keys for a normalized name: its first and last tokens."""
+        tokens = normalized_name.split()
+        return {tokens[0], tokens[-1]} if tokens else set()
+
+    def _index_name(self, candidate_id: str, name: Optional[str]) -> None:
+        """Register (or re-touch) a stored candidate under its name's blocking keys."""
+        if not name:
+            return
+        normalized = self._normalize_name(name)
+        for block in self._name_blocks(normalized):
+            bucket = self._name_block_index[block]
+            bucket[candidate_id] = normalized
+            bucket.move_to_end(candidate_id)
+            if len(bucket) > self.name_block_limit:
+                bucket.popitem(last=False)  # Drop the least recently touched
+
+    def _name_neighbors(self, normalized_name: str) -> Dict[str, str]:
+        """Stored candidates (id -> normalized name) sharing a first or last name token, most recent first."""
+        neighbors: Dict[str, str] = {}
+        for block in self._name_blocks(normalized_name):
+            bucket = self._name_block_index.get(block)
+            if bucket:
+                for candidate_id, name in reversed(bucket.items()):
+                    neighbors.setdefault(candidate_id, name)
+        return neighbors
+
     def _find_existing(self, candidate: Candidate) -> Optional[str]:
         """Find existing candidate ID if this is a duplicate."""
         # Check exact matches first - prioritized by reliability
@@ -234,24 +406,31 @@ class CandidateDeduper:
             if domain and domain in self._domain_index:
                 return self._domain_index[domain]
 
-        # Check name + any common identifier similarity
-        if candidate.name:
-            for existing in self.candidates.values():
-                if existing.name:
-                    name_sim = self._name_similarity(candidate.name, existing.name)
-                    if name_sim > self.similarity_threshold:
-                        # Additional check: same domain or handle
-                        if self._has_common_identifier(candidate, existing):
-                            return existing.id
-
-        # Cross-reference check: same name with high confidence and overlapping sources
-        # e.g., if found on both GitHub and Dev.to with same name
-        if candidate.name and len(candidate.name) > 5:
-            for existing in self.candidates.values():
-                if existing.name and self._name_similarity(candidate.name, existing.name) > 0.9:
-                    # Check if they have complementary identifiers that could be same person
-                    if self._likely_same_person(candidate, existing):
-                        return existing.id
+        if not candidate.name:
+            return None
+
+        name = self._normalize_name(candidate.name)
+        cross_check = len(candidate.name) > 5
+
+        # Only names sharing a first/last token can plausibly clear the thresholds;
+        # score each neighbor once and apply both checks to it
+        for existing_id, existing_name in self._name_neighbors(name).items():
+            name_sim = self._name_similarity(name, existing_name)
+            if name_sim <= 0.9 and name_sim <= self.similarity_threshold:
+                continue
+            existing = self.candidates[existing_id]
+
+            # Similar name + any common identifier
+            if name_sim > self.similarity_threshold:
+                if self._has_common_identifier(candidate, existing):
+                    return existing_id
+
+            # Cross-reference check: same name with high confidence and overlapping sources
+            # e.g., if found on both GitHub and Dev.to with same name
+            if cross_check and name_sim > 0.9:
+                # Check if they have complementary identifiers that could be same person
+                if self._likely_same_person(candidate, existing):
+                    return existing_id
 
         return None
 
@@ -266,111 +445,65 @@ class CandidateDeduper:
 
         # Same demo URLs
         if c1.demo_urls and c2.demo_urls:
-            c1_domains = {self._extract_domain(u) for u in c1.demo_urls if u}
-            c2_domains = {self._extract_domain(u) for u in c2.demo_urls if u}
-            if c1_domains & c2_domains:  # Intersection
+            if not c1.demo_domains.isdisjoint(c2.demo_domains):
                 return True
 
         # One has GitHub username that matches the other's Twitter/HN handle
-        handles1 = {h.lower() for h in [c1.github_username, c1.hn_username, c1.twitter_handle] if h}
-        handles2 = {h.lower() for h in [c2.github_username, c2.hn_username, c2.twitter_handle] if h}
-        if handles1 & handles2:
+        if not c1.handle_set.isdisjoint(c2.handle_set):
             return True
 
         return False
 
-    def _update_indices(self, candidate: Candidate) -> None:
-        """Update lookup indices for a candidate."""
+    def _update_indices(self, candidate: Candidate, candidate_id: str) -> None:
+        """Point lookup indices at the key a candidate is stored under in self.candidates."""
         if candidate.github_username:
-            self._github_index[candidate.github_username.lower()] = candidate.id
+            self._github_index[candidate.github_username.lower()] = candidate_id
 
         if candidate.hn_username:
-            self._hn_index[candidate.hn_username.lower()] = candidate.id
+            self._hn_index[candidate.hn_username.lower()] = candidate_id
 
         if candidate.reddit_username:
-            self._reddit_index[candidate.reddit_username.lower()] = candidate.id
+            self._reddit_index[candidate.reddit_username.lower()] = candidate_id
 
         if candidate.twitter_handle:
-            self._twitter_index[candidate.twitter_handle.lower()] = candidate.id
+            self._twitter_index[candidate.twitter_handle.lower()] = candidate_id
 
         if candidate.linkedin_url:
             key = self._normalize_linkedin_url(candidate.linkedin_url)
             if key:
-                self._linkedin_index[key] = candidate.id
+                self._linkedin_index[key] = candidate_id
 
         if candidate.email:
-            self._email_index[candidate.email.lower()] = candidate.id
+            self._email_index[candidate.email.lower()] = candidate_id
 
         if candidate.website:
             domain = self._extract_domain(candidate.website)
             if domain:
-                self._domain_index[domain] = candidate.id
+                self._domain_index[domain] = candidate_id
 
     @staticmethod
     def _normalize_linkedin_url(url: str) -> Optional[str]:
         """Extract LinkedIn username from URL for indexing."""
         if not url:
             return None
-        match = re.search(r"linkedin\.com/in/([a-zA-Z0-9_-]+)", url, re.I)
-        return match.group(1).lower() if match else None
+        return _linkedin_username(url)
 
     @staticmethod
     def _extract_domain(url: str) -> Optional[str]:
         """Extract domain from URL, excluding common platforms."""
         if not url:
             return None
-
-        match = re.search(r"https?://(?:www\.)?([^/]+)", url)
-        if not match:
-            return None
-
-        domain = match.group(1).lower()
-
-        # Skip common platforms that don't identify individuals
-        skip_domains = {
-            "github.com", "twitter.com", "x.com", "linkedin.com",
-            "medium.com", "substack.com", "youtube.com",
-        }
-
-        if domain in skip_domains:
-            return None
-
-        return domain
+        return _identifying_domain(url)
 
     @staticmethod
     def _name_similarity(name1: str, name2: str) -> float:
-        """Calculate similarity between two names."""
-        n1 = name1.lower().strip()
-        n2 = name2.lower().strip()
-        return SequenceMatcher(None, n1, n2).ratio()
+        """Calculate similarity between two names already passed through _normalize_name."""
+        return SequenceMatcher(None, name1, name2).ratio()
 
     @staticmethod
     def _has_common_identifier(c1: Candidate, c2: Candidate) -> bool:
         """Check if two candidates share any identifier."""
-        if c1.github_username and c2.github_username:
-            if c1.github_username.lower() == c2.github_username.lower():
-                return True
-
-        if c1.hn_username and c2.hn_username:
-            if c1.hn_username.lower() == c2.hn_username.lower():
-                return True
-
-        if c1.twitter_handle and c2.twitter_handle:
-            if c1.twitter_handle.lower() == c2.twitter_handle.lower():
-                return True
-
-        if c1.email and c2.email:
-            if c1.email.lower() == c2.email.lower():
-                return True
-
-        if c1.linkedin_url and c2.linkedin_url:
-            # Compare LinkedIn usernames
-            l1 = re.search(r"linkedin\.com/in/([a-zA-Z0-9_-]+)", c1.linkedin_url, re.I)
-            l2 = re.search(r"linkedin\.com/in/([a-zA-Z0-9_-]+)", c2.linkedin_url, re.I)
-            if l1 and l2 and l1.group(1).lower() == l2.group(1).lower():
-                return True
-
-        return False
+        return not c1.identifier_set.isdisjoint(c2.identifier_set)
 
     def get_all(self) -> List[Candidate]:
         """Get all deduplicated candidates."""
@@ -0,0 +1,102 @@
+"""On-disk HTTP response cache so repeat crawls skip unchanged requests."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class ResponseCache:
+    """
+    Disk cache of successful GET responses keyed by URL + query params.
+
+    Callers decide freshness from the stored age; stale entries can be
+    revalidated with the ETag / Last-Modified validators they carry.
+    Entries hold only plain data (status, headers, body), so a cache stays
+    readable across requests/urllib3 upgrades.
+    """
+
+    def __init__(self, cache_dir: str = ".http_cache"):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str, params: Optional[Dict]) -> Path:
+        """Cache file for a URL + params pair."""
+        key = url
+        if params:
+            key += "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.entry"
+
+    def load(self, url: str, params: Optional[Dict] = None) -> Optional[Tuple[float, requests.Response]]:
+        """Return (age in seconds, response) for a cached entry, or None."""
+        path = self._path(url, params)
+        try:
+            age = time.time() - path.stat().st_mtime
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+            return age, self._to_response(entry)
+        except Exception:
+            # Unreadable, truncated or foreign entries are just misses
+            return None
+
+    def store(self, url: str, params: Optional[Dict], response: requests.Response) -> None:
+        """Write a response to the cache (atomically, so readers never see partial files)."""
+        path = self._path(url, params)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(self._to_entry(response), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _to_entry(response: requests.Response) -> Dict:
+        """Plain-data snapshot of a response (builtins only)."""
+        return {
+            "url": response.url,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+            "encoding": response.encoding,
+            "content": response.content,
+        }
+
+    @staticmethod
+    def _to_response(entry: Dict) -> requests.Response:
+        """Rebuild a requests.Response from a cached snapshot."""
+        response = requests.Response()
+        response.url = entry["url"]
+        response.status_code = entry["status_code"]
+        response.reason = entry["reason"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = entry["encoding"]
+        response._content = entry["content"]
+        return response
+
+    def touch(self, url: str, params: Optional[Dict] = None) -> None:
+        """Mark an entry fresh again after a 304 revalidation."""
+        try:
+            os.utime(self._path(url, params))
+        except OSError:
+            pass
+
+    @staticmethod
+    def validators(response: requests.Response) -> Dict[str, str]:
+        """Conditional request headers for revalidating a cached response."""
+        headers = {}
+        if response.headers.get("ETag"):
+            headers["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = response.headers["Last-Modified"]
+        return headers
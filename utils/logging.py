@@ -1,9 +1,12 @@
 """Structured logging utilities."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import time
 from typing import Optional
-from datetime import datetime
 
 
 class StructuredFormatter(logging.Formatter):
@@ -21,9 +24,16 @@ class StructuredFormatter(logging.Formatter):
     def __init__(self, use_colors: bool = True):
         super().__init__()
         self.use_colors = use_colors and sys.stdout.isatty()
+        # Timestamps only show whole seconds, so reuse the last one
+        self._last_sec = -1
+        self._last_ts = ""
 
     def format(self, record: logging.LogRecord) -> str:
-        timestamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_ts = time.strftime("%H:%M:%S", time.localtime(sec))
+        timestamp = self._last_ts
         level = record.levelname
 
         if self.use_colors:
@@ -33,15 +43,31 @@ class StructuredFormatter(logging.Formatter):
         else:
             level_str = f"{level:8}"
 
-        # Extract source if present
-        source = getattr(record, "source", "")
-        source_str = f"[{source}] " if source else ""
+        # Source and progress arrive as record attributes via `extra`
+        attrs = record.__dict__
+        source = attrs.get("source")
+        progress = attrs.get("progress")
+        message = record.getMessage()
+        if not source and not progress:
+            return f"{timestamp} {level_str} {message}"
 
-        # Extract progress if present
-        progress = getattr(record, "progress", "")
+        source_str = f"[{source}] " if source else ""
         progress_str = f"({progress}) " if progress else ""
 
-        return f"{timestamp} {level_str} {source_str}{progress_str}{record.getMessage()}"
+        return f"{timestamp} {level_str} {source_str}{progress_str}{message}"
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the listener thread.
+
+    Only the message arguments are merged on the caller's thread, so
+    later mutation of those arguments can't change what gets logged.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 class SourceAdapter(logging.LoggerAdapter):
@@ -54,6 +80,7 @@ class SourceAdapter(logging.LoggerAdapter):
 
 
 _loggers: dict = {}
+_adapters: dict = {}
 
 
 def setup_logger(
@@ -70,9 +97,15 @@ def setup_logger(
     logger.setLevel(level)
     logger.propagate = False
 
+    # Callers only enqueue records; a background listener formats them
+    # and writes to stdout so logging never blocks on terminal I/O.
+    log_queue = queue.SimpleQueue()
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(StructuredFormatter(use_colors=use_colors))
-    logger.addHandler(handler)
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(_QueueHandler(log_queue))
 
     _loggers[name] = logger
     return logger
@@ -80,14 +113,20 @@ def setup_logger(
 
 def get_logger(name: str = "vibe_coder", source: Optional[str] = None) -> logging.LoggerAdapter:
     """Get a logger, optionally with source context."""
+    adapter = _adapters.get((name, source))
+    if adapter is not None:
+        return adapter
+
     if name not in _loggers:
         setup_logger(name)
 
     logger = _loggers[name]
 
     if source:
-        return SourceAdapter(logger, {"source": source})
-    return SourceAdapter(logger, {})
+        adapter = SourceAdapter(logger, {"source": source})
+    else:
+        adapter = SourceAdapter(logger, {})
+    return _adapters.setdefault((name, source), adapter)
 
 
 def log_progress(
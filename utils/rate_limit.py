@@ -2,10 +2,58 @@
 
 import time
 import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Dict, Optional
 from dataclasses import dataclass, field
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import Retrying, retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity.wait import wait_base
 import requests
+from requests.adapters import HTTPAdapter
+
+from .http_cache import ResponseCache
+
+# Failures worth retrying (429 and 5xx responses surface as HTTPError)
+_RETRYABLE_ERRORS = (
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.HTTPError,
+)
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date); None if absent or malformed."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class _WaitRetryAfter(wait_base):
+    """Wait out a 429's Retry-After (capped at max_wait), else defer to a fallback wait."""
+
+    def __init__(self, fallback: wait_base, max_wait: float):
+        self.fallback = fallback
+        self.max_wait = max_wait
+
+    def __call__(self, retry_state) -> float:
+        outcome = retry_state.outcome
+        if outcome is not None and outcome.failed:
+            response = getattr(outcome.exception(), "response", None)
+            if response is not None and response.status_code == 429:
+                delay = _retry_after_seconds(response.headers.get("Retry-After"))
+                if delay is not None:
+                    return min(delay, self.max_wait)
+        return self.fallback(retry_state)
 
 
 @dataclass
@@ -15,14 +63,19 @@ class RateLimitConfig:
     max_retries: int = 3
     initial_backoff: float = 1.0
     max_backoff: float = 60.0
+    min_requests_per_second: float = 0.1  # Floor when backing off after 429s
+    rate_increase: float = 0.05  # Additive recovery per successful request
+    cache_ttl: float = 0.0  # Seconds a cached GET is served without revalidating (0 = never cache)
 
 
 # Default configs per source
 DEFAULT_CONFIGS: Dict[str, RateLimitConfig] = {
     "github": RateLimitConfig(requests_per_second=1.0, max_retries=5),
     "brave": RateLimitConfig(requests_per_second=1.0, max_retries=3),
-    "hn": RateLimitConfig(requests_per_second=2.0, max_retries=3),
+    "hn": RateLimitConfig(requests_per_second=2.0, max_retries=3, cache_ttl=3600.0),
+    "producthunt": RateLimitConfig(requests_per_second=1.0, max_retries=3, cache_ttl=600.0),
     "web": RateLimitConfig(requests_per_second=2.0, max_retries=2),
+    "yc": RateLimitConfig(requests_per_second=2.0, max_retries=2),
 }
 
 
@@ -32,23 +85,63 @@ class RateLimiter:
 
     configs: Dict[str, RateLimitConfig] = field(default_factory=lambda: DEFAULT_CONFIGS.copy())
     _last_request: Dict[str, float] = field(default_factory=dict)
+    _current_rate: Dict[str, float] = field(default_factory=dict)
     _lock: threading.Lock = field(default_factory=threading.Lock)
+    _source_locks: Dict[str, threading.Lock] = field(default_factory=dict)
+    _retryers: Dict[str, Retrying] = field(default_factory=dict)
 
-    def wait(self, source: str) -> None:
-        """Wait if necessary to respect rate limits for the given source."""
+    def get_rate(self, source: str) -> float:
+        """Get the current (adaptive) requests per second for a source."""
         config = self.configs.get(source, RateLimitConfig())
-        min_interval = 1.0 / config.requests_per_second
+        return self._current_rate.get(source, config.requests_per_second)
 
+    def record_throttled(self, source: str) -> None:
+        """Halve the source's rate after a throttling response (AIMD decrease)."""
+        config = self.configs.get(source, RateLimitConfig())
         with self._lock:
-            now = time.time()
-            last = self._last_request.get(source, 0)
-            elapsed = now - last
+            rate = max(config.min_requests_per_second, self.get_rate(source) / 2)
+            self._current_rate[source] = rate
+
+    def record_success(self, source: str) -> None:
+        """Creep the source's rate back toward its configured ceiling (AIMD increase)."""
+        config = self.configs.get(source, RateLimitConfig())
+        rate = self.get_rate(source)
+        if rate < config.requests_per_second:
+            with self._lock:
+                self._current_rate[source] = min(
+                    config.requests_per_second, rate + config.rate_increase
+                )
+
+    def _source_lock(self, source: str) -> threading.Lock:
+        """Get or create the lock guarding one source's request schedule."""
+        lock = self._source_locks.get(source)
+        if lock is None:
+            with self._lock:
+                lock = self._source_locks.setdefault(source, threading.Lock())
+        return lock
 
-            if elapsed < min_interval:
-                sleep_time = min_interval - elapsed
-                time.sleep(sleep_time)
+    def wait(self, source: str) -> None:
+        """Wait if necessary to respect rate limits for the given source."""
+        min_interval = 1.0 / self.get_rate(source)
 
-            self._last_request[source] = time.time()
+        # Reserve the next slot under the source's own lock, then sleep outside it,
+        # so other sources (and this source's next caller) never queue behind a sleep
+        with self._source_lock(source):
+            now = time.monotonic()
+            last = self._last_request.get(source)
+            slot = now if last is None else max(now, last + min_interval)
+            self._last_request[source] = slot
+
+        if slot > now:
+            time.sleep(slot - now)
+
+    @staticmethod
+    def _retry_wait(config: RateLimitConfig) -> wait_base:
+        """Retry-After for throttled responses, exponential backoff otherwise."""
+        return _WaitRetryAfter(
+            fallback=wait_exponential(multiplier=config.initial_backoff, max=config.max_backoff),
+            max_wait=config.max_backoff,
+        )
 
     def get_retry_decorator(self, source: str):
         """Get a tenacity retry decorator configured for the given source."""
@@ -56,22 +149,37 @@ class RateLimiter:
 
         return retry(
             stop=stop_after_attempt(config.max_retries),
-            wait=wait_exponential(
-                multiplier=config.initial_backoff,
-                max=config.max_backoff
-            ),
-            retry=retry_if_exception_type((
-                requests.exceptions.Timeout,
-                requests.exceptions.ConnectionError,
-                requests.exceptions.HTTPError,
-            )),
+            wait=self._retry_wait(config),
+            retry=retry_if_exception_type(_RETRYABLE_ERRORS),
             reraise=True,
         )
 
+    def get_retryer(self, source: str) -> Retrying:
+        """Get the tenacity retryer for the given source (built once, then shared)."""
+        retryer = self._retryers.get(source)
+        if retryer is None:
+            config = self.configs.get(source, RateLimitConfig())
+            retryer = Retrying(
+                stop=stop_after_attempt(config.max_retries),
+                wait=self._retry_wait(config),
+                retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+                reraise=True,
+            )
+            with self._lock:
+                retryer = self._retryers.setdefault(source, retryer)
+        return retryer
+
 
 # Global rate limiter instance
 _global_limiter: Optional[RateLimiter] = None
 
+# Optional on-disk response cache (disabled unless enable_response_cache is called)
+_response_cache: Optional[ResponseCache] = None
+
+# Shared session so requests to the same host reuse keep-alive connections
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
 
 def get_rate_limiter() -> RateLimiter:
     """Get or create the global rate limiter."""
@@ -81,6 +189,28 @@ def get_rate_limiter() -> RateLimiter:
     return _global_limiter
 
 
+def _get_session() -> requests.Session:
+    """Get or create the pooled HTTP session shared by all sources."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # Crawlers fan out over thread pools, so allow that many connections per host
+                adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def enable_response_cache(cache_dir: str = ".http_cache") -> ResponseCache:
+    """Cache GET responses on disk for sources with a cache_ttl."""
+    global _response_cache
+    _response_cache = ResponseCache(cache_dir)
+    return _response_cache
+
+
 def rate_limited_request(
     source: str,
     method: str,
@@ -89,8 +219,6 @@ def rate_limited_request(
 ) -> requests.Response:
     """Make a rate-limited HTTP request with automatic retries."""
     limiter = get_rate_limiter()
-    limiter.wait(source)
-
     config = limiter.configs.get(source, RateLimitConfig())
 
     # Set reasonable defaults
@@ -98,24 +226,36 @@ def rate_limited_request(
     kwargs.setdefault("headers", {})
     kwargs["headers"].setdefault("User-Agent", "VibeCoder-Finder/1.0 (Recruiting Research Tool)")
 
-    @retry(
-        stop=stop_after_attempt(config.max_retries),
-        wait=wait_exponential(multiplier=config.initial_backoff, max=config.max_backoff),
-        retry=retry_if_exception_type((
-            requests.exceptions.Timeout,
-            requests.exceptions.ConnectionError,
-        )),
-        reraise=True,
-    )
+    # Serve fresh cache hits without touching the network; revalidate stale ones
+    cache = _response_cache if config.cache_ttl > 0 and method.upper() == "GET" else None
+    cached = None
+    if cache is not None:
+        entry = cache.load(url, kwargs.get("params"))
+        if entry is not None:
+            age, cached = entry
+            if age < config.cache_ttl:
+                return cached
+            kwargs["headers"] = {**kwargs["headers"], **cache.validators(cached)}
+
     def _make_request():
-        response = requests.request(method, url, **kwargs)
-        # Retry on rate limit responses
+        # Every attempt waits, so retries honour a rate lowered by a 429
+        limiter.wait(source)
+        response = _get_session().request(method, url, **kwargs)
+        # Retry on rate limit responses; the retryer's wait honours Retry-After
         if response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", 60))
-            time.sleep(min(retry_after, config.max_backoff))
+            limiter.record_throttled(source)
             response.raise_for_status()
         elif response.status_code >= 500:
             response.raise_for_status()
+        else:
+            limiter.record_success(source)
         return response
 
-    return _make_request()
+    response = limiter.get_retryer(source)(_make_request)
+    if cache is not None:
+        if response.status_code == 304 and cached is not None:
+            cache.touch(url, kwargs.get("params"))
+            return cached
+        if response.status_code == 200:
+            cache.store(url, kwargs.get("params"), response)
+    return response
@@ -1,10 +1,20 @@
 """Text processing utilities."""
 
 import re
-from typing import List, Set, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from typing import FrozenSet, List, Set, Tuple
+
+try:
+    import ahocorasick  # Optional speedup: all keywords in one pass over the text
+except ImportError:
+    ahocorasick = None
+
+# Whitespace runs other than newlines (for normalizing text line by line in one pass)
+_INLINE_WHITESPACE_RE = re.compile(r"[^\S\n]+")
 
 # Keywords for vibe coding signals
-VIBE_CODING_KEYWORDS = {
+VIBE_CODING_KEYWORDS = frozenset({
     # Tools
     "cursor", "cursor ai", "cursor.sh",
     "v0", "v0.dev", "vercel v0",
@@ -34,10 +44,10 @@ VIBE_CODING_KEYWORDS = {
     "llm app", "llm application",
     "built in a weekend", "shipped in a weekend",
     "24 hours", "48 hours",
-}
+})
 
 # Founder/incubator signals
-FOUNDER_KEYWORDS = {
+FOUNDER_KEYWORDS = frozenset({
     "founder", "co-founder", "cofounder",
     "yc", "y combinator", "ycombinator",
     "antler",
@@ -51,10 +61,10 @@ FOUNDER_KEYWORDS = {
     "bootstrapped", "bootstrap",
     "product manager", "pm", "product lead",
     "head of product",
-}
+})
 
 # Fintech signals
-FINTECH_KEYWORDS = {
+FINTECH_KEYWORDS = frozenset({
     "fintech", "fin-tech",
     "payments", "payment",
     "banking", "neobank",
@@ -66,17 +76,18 @@ FINTECH_KEYWORDS = {
     "financial", "finance",
     "credit", "lending", "loan",
     "insurance", "insurtech",
-}
+})
+
+# Every signal keyword (default set for keyword and evidence extraction)
+ALL_KEYWORDS = VIBE_CODING_KEYWORDS | FOUNDER_KEYWORDS | FINTECH_KEYWORDS
 
 
 def normalize_text(text: str) -> str:
     """Normalize text for comparison."""
     if not text:
         return ""
-    # Lowercase and normalize whitespace
-    text = text.lower().strip()
-    text = re.sub(r"\s+", " ", text)
-    return text
+    # Lowercase and normalize whitespace (split() collapses the same runs \s+ does)
+    return " ".join(text.lower().split())
 
 
 def truncate_text(text: str, max_length: int = 500, suffix: str = "...") -> str:
@@ -86,15 +97,73 @@ def truncate_text(text: str, max_length: int = 500, suffix: str = "...") -> str:
     return text[: max_length - len(suffix)] + suffix
 
 
+def _is_word_char(char: str) -> bool:
+    """Whether char counts as a word character for regex word-boundary purposes."""
+    return char.isalnum() or char == "_"
+
+
+@lru_cache(maxsize=32)
+def _keyword_automaton(keywords: FrozenSet[str]):
+    """Aho-Corasick automaton over a keyword set (built once per distinct set)."""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword.lower(), keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=1024)
+def _keyword_pattern(keyword: str) -> re.Pattern:
+    """Compiled pattern for one keyword (matches lowercased text)."""
+    # Use word boundaries for single words, looser matching for phrases
+    escaped = re.escape(keyword.lower())
+    if " " in keyword:
+        return re.compile(escaped)
+    return re.compile(r"\b" + escaped + r"\b")
+
+
+def _first_keyword_spans(normalized: str, keyword_set: Set[str]) -> List[Tuple[str, int, int]]:
+    """(keyword, start, end) of each keyword's first match in normalized text."""
+    spans = []
+
+    if ahocorasick is not None:
+        seen = set()
+        length = len(normalized)
+        for last, keyword in _keyword_automaton(frozenset(keyword_set)).iter(normalized):
+            if keyword in seen:
+                continue
+            start = last - len(keyword) + 1
+            end = last + 1
+            # Word boundaries for single words, looser matching for phrases
+            if " " not in keyword:
+                if start > 0 and _is_word_char(normalized[start - 1]) and _is_word_char(keyword[0]):
+                    continue
+                if end < length and _is_word_char(normalized[end]) and _is_word_char(keyword[-1]):
+                    continue
+            seen.add(keyword)
+            spans.append((keyword, start, end))
+        return spans
+
+    for keyword in keyword_set:
+        # Plain substring test first: most keywords are absent from most texts
+        if keyword.lower() not in normalized:
+            continue
+        match = _keyword_pattern(keyword).search(normalized)
+        if match:
+            spans.append((keyword, match.start(), match.end()))
+
+    return spans
+
+
 def extract_keywords(text: str, keyword_set: Set[str] = None) -> List[Tuple[str, str]]:
     """
     Extract matching keywords from text.
 
     Returns list of (keyword, context) tuples where context is
-    the surrounding text snippet.
+    the surrounding text snippet of the keyword's first match.
     """
     if keyword_set is None:
-        keyword_set = VIBE_CODING_KEYWORDS | FOUNDER_KEYWORDS | FINTECH_KEYWORDS
+        keyword_set = ALL_KEYWORDS
 
     if not text:
         return []
@@ -102,32 +171,48 @@ def extract_keywords(text: str, keyword_set: Set[str] = None) -> List[Tuple[str,
     normalized = normalize_text(text)
     matches = []
 
-    for keyword in keyword_set:
-        # Use word boundaries for single words, looser matching for phrases
-        if " " in keyword:
-            pattern = re.escape(keyword)
-        else:
-            pattern = r"\b" + re.escape(keyword) + r"\b"
-
-        for match in re.finditer(pattern, normalized, re.IGNORECASE):
-            start = max(0, match.start() - 50)
-            end = min(len(normalized), match.end() + 50)
-            context = normalized[start:end].strip()
-            if start > 0:
-                context = "..." + context
-            if end < len(normalized):
-                context = context + "..."
-            matches.append((keyword, context))
-
-    # Dedupe by keyword
-    seen = set()
-    unique_matches = []
-    for keyword, context in matches:
-        if keyword not in seen:
-            seen.add(keyword)
-            unique_matches.append((keyword, context))
+    for keyword, match_start, match_end in _first_keyword_spans(normalized, keyword_set):
+        start = max(0, match_start - 50)
+        end = min(len(normalized), match_end + 50)
+        context = normalized[start:end].strip()
+        if start > 0:
+            context = "..." + context
+        if end < len(normalized):
+            context = context + "..."
+        matches.append((keyword, context))
+
+    return matches
+
+
+def _evidence_lines_automaton(
+    text: str, lines: List[str], keywords: Set[str], max_lines: int
+) -> List[str]:
+    """extract_evidence_lines via one automaton pass over the whole text."""
+    # Same per-line normalization as normalize_text, but keeping the newlines
+    normalized = _INLINE_WHITESPACE_RE.sub(" ", text.lower())
+    line_starts = [0]
+    newline = normalized.find("\n")
+    while newline != -1:
+        line_starts.append(newline + 1)
+        newline = normalized.find("\n", newline + 1)
 
-    return unique_matches
+    evidence = []
+    last_line = -1
+    for end, _ in _keyword_automaton(frozenset(keywords)).iter(normalized):
+        line_index = bisect_right(line_starts, end) - 1
+        if line_index == last_line:
+            continue
+        last_line = line_index
+
+        line = lines[line_index].strip()
+        if len(line) < 10:
+            continue
+
+        evidence.append(truncate_text(line, 200))
+        if len(evidence) >= max_lines:
+            break
+
+    return evidence
 
 
 def extract_evidence_lines(text: str, max_lines: int = 8) -> List[str]:
@@ -135,17 +220,21 @@ def extract_evidence_lines(text: str, max_lines: int = 8) -> List[str]:
     if not text:
         return []
 
-    all_keywords = VIBE_CODING_KEYWORDS | FOUNDER_KEYWORDS | FINTECH_KEYWORDS
     lines = text.split("\n")
+
+    if ahocorasick is not None:
+        return _evidence_lines_automaton(text, lines, ALL_KEYWORDS, max_lines)
+
+    # Lowercase and collapse whitespace once for the whole text, not per line
+    normalized_lines = _INLINE_WHITESPACE_RE.sub(" ", text.lower()).split("\n")
     evidence = []
 
-    for line in lines:
+    for line, normalized in zip(lines, normalized_lines):
         line = line.strip()
         if not line or len(line) < 10:
             continue
 
-        normalized = normalize_text(line)
-        for keyword in all_keywords:
+        for keyword in ALL_KEYWORDS:
             if keyword in normalized:
                 evidence.append(truncate_text(line, 200))
                 break
@@ -162,35 +251,38 @@ def clean_html_text(text: str) -> str:
         return ""
 
     # Remove excessive whitespace
-    text = re.sub(r"\s+", " ", text)
+    text = " ".join(text.split())
     # Remove common HTML artifacts
     text = re.sub(r"<!--.*?-->", "", text)
     text = text.strip()
     return text
 
 
+_URL_RE = re.compile(r"https?://[^\s<>\"')\]]+[^\s<>\"')\].,;:!?]")
+
+
 def extract_urls(text: str) -> List[str]:
-    """Extract URLs from text."""
+    """Extract unique URLs from text, in order of first appearance."""
     if not text:
         return []
 
-    url_pattern = r"https?://[^\s<>\"')\]]+[^\s<>\"')\].,;:!?]"
-    urls = re.findall(url_pattern, text)
-    return list(set(urls))
+    return list(dict.fromkeys(_URL_RE.findall(text)))
 
 
+_PERSONAL_SITE_INDICATORS = (
+    ".me/", ".io/", ".dev/",
+    "blog.", "about.",
+    "/about", "/blog",
+    "substack.com", "medium.com/@",
+    "github.io",
+)
+
+
+@lru_cache(maxsize=4096)
 def is_likely_personal_site(url: str) -> bool:
     """Check if URL is likely a personal site or blog."""
     if not url:
         return False
 
-    personal_indicators = [
-        ".me/", ".io/", ".dev/",
-        "blog.", "about.",
-        "/about", "/blog",
-        "substack.com", "medium.com/@",
-        "github.io",
-    ]
-
     url_lower = url.lower()
-    return any(ind in url_lower for ind in personal_indicators)
+    return any(ind in url_lower for ind in _PERSONAL_SITE_INDICATORS)